@@ -13,18 +13,57 @@ Example:
 """
 
 import argparse
-import glob
+import contextlib
+import io
 import os
 import re
+import stat
+import struct
 import sys
+from array import array
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
-from labchart_exporter import LabChartExporter
+from labchart_exporter import OUTPUT_BUFFER_SIZE, LabChartExporter
 from ndf_reader import TextSignalReader
 
+# Compiled once per process (and per worker) rather than per directory
+_E_CHANNEL_RE = re.compile(r"E(\d+)\.txt(\.gz)?")
+_SESSION_RE = re.compile(r"session_(\d{10})")
 
-def find_channel_directories(input_dir: str) -> List[str]:
+# Background threads used to read channel files ahead of parsing
+_READ_AHEAD_THREADS = 4
+
+# Parsed-sample cache files written next to E{channel}.txt files (opt-in):
+# header = magic, array typecode, byte order, source size, source mtime (ns)
+_CACHE_SUFFIX = ".samples"
+_CACHE_MAGIC = b"NLC1"
+_CACHE_HEADER = struct.Struct("<4scc2xqq")
+
+# Result of a background channel read: raw file contents, or already parsed
+# samples when they came from the cache
+_ChannelRead = Union[bytes, array]
+
+# Channel number -> (file path, stat result from the directory scan, or None
+# where the file wasn't scanned)
+_ChannelFiles = Mapping[int, Tuple[str, Optional[os.stat_result]]]
+
+# A started channel read: (channel number, file path, stat result, future).
+# Future is quoted because it is only subscriptable at runtime from 3.9 on
+_PendingRead = Tuple[int, str, Optional[os.stat_result], "Future[_ChannelRead]"]
+
+# Channels with a non-default sample rate (channel 0 is the 128 Hz clock signal)
+_CHANNEL_SAMPLE_RATE: Dict[int, float] = {0: 128.0}
+_DEFAULT_SAMPLE_RATE = 512.0
+
+
+def find_channel_directories(input_dir: str, sort: bool = True) -> List[str]:
     """
     Find all session subdirectories that contain E{channel}.txt files.
 
@@ -33,28 +72,63 @@ def find_channel_directories(input_dir: str) -> List[str]:
 
     Args:
         input_dir: Parent directory to search
+        sort: Sort the directories chronologically (set to False when the
+            order doesn't matter to skip the sort)
+
+    Returns:
+        List of session directory paths containing channel files, sorted
+        chronologically unless sort is False
+    """
+    return [path for _, path, _ in _find_session_directories(input_dir, sort)]
+
+
+def _find_session_directories(
+    input_dir: str,
+    sort: bool = True,
+) -> List[Tuple[Optional[int], str, Dict[int, Tuple[str, os.stat_result]]]]:
+    """
+    Find channel directories along with their session timestamps and files.
+
+    Each subdirectory is scanned exactly once; the resulting channel file map
+    is handed on to convert_directory instead of being rescanned there.
+
+    Args:
+        input_dir: Parent directory to search
+        sort: Sort the result (otherwise directory listing order is kept)
 
     Returns:
-        List of session directory paths containing channel files, sorted chronologically
+        List of (session timestamp or None, directory path, channel files)
+        tuples, where channel files is the _scan_channel_files result. When
+        sorted, session directories come first ordered by timestamp, then any
+        other directories ordered by path.
     """
-    subdirs = []
+    sessions = []
 
-    # Look for all subdirectories
-    for entry in os.listdir(input_dir):
-        full_path = os.path.join(input_dir, entry)
-        if os.path.isdir(full_path):
-            # Check if this directory contains any E{channel}.txt files
-            channel_files = glob.glob(os.path.join(full_path, "E*.txt"))
-            if channel_files:
-                subdirs.append(full_path)
+    # Look for all subdirectories (DirEntry caches the file type from readdir)
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            scanned_files = _scan_channel_files(entry.path)
+            if scanned_files:
+                timestamp = _session_timestamp(entry.name)
+                sessions.append((timestamp, entry.path, scanned_files))
 
-    # Sort by directory name (which includes timestamp for session directories)
-    return sorted(subdirs)
+    # Timestamps are extracted once here and reused by convert_directory
+    if sort:
+        sessions.sort(key=lambda s: (s[0] is None, s[0] or 0, s[1]))
+    return sessions
+
+
+def _session_timestamp(dir_name: str) -> Optional[int]:
+    """Extract the Unix timestamp from a session_{timestamp} directory name."""
+    match = _SESSION_RE.match(dir_name)
+    return int(match.group(1)) if match else None
 
 
 def find_channel_files(directory: str) -> Dict[int, str]:
     """
-    Find all E{channel}.txt files in a directory.
+    Find all E{channel}.txt (or gzip-compressed E{channel}.txt.gz) files.
 
     Args:
         directory: Directory to search
@@ -62,47 +136,179 @@ def find_channel_files(directory: str) -> Dict[int, str]:
     Returns:
         Dictionary mapping channel numbers to file paths
     """
+    return {
+        channel_num: file_path
+        for channel_num, (file_path, _) in _scan_channel_files(directory).items()
+    }
+
+
+def _scan_channel_files(directory: str) -> Dict[int, Tuple[str, os.stat_result]]:
+    """
+    Scan a directory for non-empty E{channel}.txt files.
+
+    The stat result of each file is kept so later steps (creation date
+    fallback, sample cache checks) don't stat the file again.
+
+    Args:
+        directory: Directory to search
+
+    Returns:
+        Dictionary mapping channel numbers to (file path, stat result), taken
+        from the single stat call made per matching entry
+    """
     channel_files = {}
-    pattern = re.compile(r"E(\d+)\.txt$")
 
-    for filename in os.listdir(directory):
-        match = pattern.match(filename)
-        if match:
-            channel_num = int(match.group(1))
-            file_path = os.path.join(directory, filename)
-            if os.path.isfile(file_path) and os.path.getsize(file_path) > 0:
-                channel_files[channel_num] = file_path
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = _E_CHANNEL_RE.fullmatch(entry.name)
+            if match and entry.is_file():
+                entry_stat = entry.stat()
+                if entry_stat.st_size > 0:
+                    channel_num = int(match.group(1))
+                    # A plain file wins over a compressed copy of the channel
+                    if match.group(2) and channel_num in channel_files:
+                        continue
+                    channel_files[channel_num] = (entry.path, entry_stat)
 
     return channel_files
 
 
+def _channel_paths(scanned_files: _ChannelFiles) -> Dict[int, str]:
+    """Strip the stat results from a _scan_channel_files result."""
+    return {
+        channel_num: file_path for channel_num, (file_path, _) in scanned_files.items()
+    }
+
+
 def load_channel_data(
     channel_files: Dict[int, str],
     interval_length: float = 1.0,
-) -> Dict[int, List[Tuple[float, List[int]]]]:
+    use_cache: bool = False,
+) -> Dict[int, List[Tuple[float, Sequence[int]]]]:
     """
     Load data from all channel files with per-channel sample rates.
 
     Channel 0 uses 128 Hz (clock signal), all other channels use 512 Hz.
+    Files are read on background threads so that disk I/O for later channels
+    overlaps with parsing of earlier ones.
 
     Args:
         channel_files: Dictionary mapping channel numbers to file paths
         interval_length: Length of each interval in seconds
+        use_cache: Load parsed samples from cache files written by earlier
+            runs, and write cache files for anything that had to be parsed
+
+    Returns:
+        Dictionary mapping channel numbers to their interval data (samples
+        are stored as compact arrays)
+    """
+    return _load_channels(
+        {channel_num: (path, None) for channel_num, path in channel_files.items()},
+        interval_length,
+        use_cache=use_cache,
+    )
+
+
+def _load_channels(
+    channel_files: _ChannelFiles,
+    interval_length: float,
+    pending_reads: Optional[List[_PendingRead]] = None,
+    use_cache: bool = False,
+) -> Dict[int, List[Tuple[float, Sequence[int]]]]:
+    """
+    Load channel files, reading them on a thread pool unless already started.
+
+    Args:
+        channel_files: Channel files, with stat results where known
+        interval_length: Length of each interval in seconds
+        pending_reads: Reads already started with _submit_reads (the files
+            are read here otherwise)
+        use_cache: Use and refresh parsed-sample cache files
+
+    Returns:
+        Dictionary mapping channel numbers to their interval data
+    """
+    if pending_reads is not None:
+        return _parse_channel_reads(pending_reads, interval_length, use_cache)
+
+    with ThreadPoolExecutor(max_workers=_READ_AHEAD_THREADS) as read_pool:
+        pending_reads = _submit_reads(read_pool, channel_files, use_cache)
+        return _parse_channel_reads(pending_reads, interval_length, use_cache)
+
+
+def _read_channel(
+    file_path: str, source: Optional[os.stat_result], use_cache: bool
+) -> _ChannelRead:
+    """Read a channel file, preferring its parsed-sample cache if enabled."""
+    if use_cache:
+        samples = _read_sample_cache(file_path, source)
+        if samples is not None:
+            return samples
+    return TextSignalReader.read_bytes(file_path)
+
+
+def _submit_reads(
+    read_pool: ThreadPoolExecutor,
+    channel_files: _ChannelFiles,
+    use_cache: bool = False,
+) -> List[_PendingRead]:
+    """
+    Start reading channel files on a thread pool.
+
+    Args:
+        read_pool: Pool to run the reads on
+        channel_files: Channel files, with stat results where known
+        use_cache: Read cached samples where a valid cache file exists
+
+    Returns:
+        List of (channel number, file path, stat result, future file contents
+        or cached samples) in channel file order
+    """
+    return [
+        (
+            channel_num,
+            file_path,
+            source,
+            read_pool.submit(_read_channel, file_path, source, use_cache),
+        )
+        for channel_num, (file_path, source) in channel_files.items()
+    ]
+
+
+def _parse_channel_reads(
+    pending_reads: List[_PendingRead],
+    interval_length: float,
+    use_cache: bool = False,
+) -> Dict[int, List[Tuple[float, Sequence[int]]]]:
+    """
+    Parse channel files as their background reads complete.
+
+    Args:
+        pending_reads: Reads started with _submit_reads
+        interval_length: Length of each interval in seconds
+        use_cache: Write a cache file for each channel that had to be parsed
 
     Returns:
         Dictionary mapping channel numbers to their interval data
     """
     channel_data = {}
 
-    for channel_num, file_path in channel_files.items():
+    for channel_num, file_path, source, future in pending_reads:
         try:
             # Auto-detect sample rate based on channel number
-            # Channel 0: 128 Hz (clock signal)
-            # Other channels: 512 Hz (default)
-            sample_rate = 128.0 if channel_num == 0 else 512.0
+            sample_rate = _CHANNEL_SAMPLE_RATE.get(channel_num, _DEFAULT_SAMPLE_RATE)
 
-            intervals = TextSignalReader.read_signal(
-                filepath=file_path,
+            # Keep samples in compact arrays rather than lists of ints
+            contents = future.result()
+            if isinstance(contents, array):
+                samples = contents
+            else:
+                samples = TextSignalReader.parse_samples(contents)
+                if use_cache:
+                    _write_sample_cache(file_path, samples, source)
+
+            intervals = TextSignalReader.split_intervals(
+                samples,
                 sample_rate=sample_rate,
                 interval_length=interval_length,
             )
@@ -119,11 +325,90 @@ def load_channel_data(
     return channel_data
 
 
+def _read_sample_cache(
+    file_path: str, source: Optional[os.stat_result] = None
+) -> Optional[array]:
+    """
+    Load the parsed samples cached for a channel file.
+
+    Args:
+        file_path: Path to the E{channel}.txt file
+        source: Stat result of the file from the directory scan (the file is
+            stat'ed here otherwise)
+
+    Returns:
+        Cached samples, or None if there is no cache file or it is stale
+        (the source file's size or modification time changed) or unreadable
+    """
+    try:
+        if source is None:
+            source = os.stat(file_path)
+        with open(file_path + _CACHE_SUFFIX, "rb") as f:
+            magic, typecode, byteorder, size, mtime_ns = _CACHE_HEADER.unpack(
+                f.read(_CACHE_HEADER.size)
+            )
+            if (
+                magic != _CACHE_MAGIC
+                or byteorder != sys.byteorder[:1].encode()
+                or size != source.st_size
+                or mtime_ns != source.st_mtime_ns
+            ):
+                return None
+
+            samples = array(typecode.decode())
+            samples.frombytes(f.read())
+            return samples
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _write_sample_cache(
+    file_path: str, samples: array, source: Optional[os.stat_result] = None
+) -> None:
+    """
+    Cache parsed samples next to a channel file for later runs.
+
+    The cache is written to a temporary file and renamed into place, so a
+    partially written cache is never picked up. Failures (e.g. a read-only
+    input directory) are ignored; the file is simply parsed again next time.
+
+    Args:
+        file_path: Path to the E{channel}.txt file the samples were parsed from
+        samples: Parsed samples
+        source: Stat result of the file from the directory scan (the file is
+            stat'ed here otherwise)
+    """
+    cache_path = file_path + _CACHE_SUFFIX
+    temp_path = cache_path + ".tmp"
+    try:
+        if source is None:
+            source = os.stat(file_path)
+        with open(temp_path, "wb") as f:
+            f.write(
+                _CACHE_HEADER.pack(
+                    _CACHE_MAGIC,
+                    samples.typecode.encode(),
+                    sys.byteorder[:1].encode(),
+                    source.st_size,
+                    source.st_mtime_ns,
+                )
+            )
+            samples.tofile(f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
 def convert_directory(
     input_dir: str,
     output_dir: str,
     exporter: LabChartExporter,
     interval_length: float = 1.0,
+    session_timestamp: Optional[int] = None,
+    scanned_files: Optional[Dict[int, Tuple[str, os.stat_result]]] = None,
+    pending_reads: Optional[List[_PendingRead]] = None,
+    use_cache: bool = False,
 ) -> Optional[str]:
     """
     Convert all channel files in a session directory to a single unified LabChart file.
@@ -136,6 +421,13 @@ def convert_directory(
         output_dir: Output directory for LabChart file
         exporter: LabChartExporter instance
         interval_length: Length of each interval in seconds
+        session_timestamp: Session timestamp if already known (parsed from the
+            directory name otherwise)
+        scanned_files: Channel files from an earlier directory scan (the
+            directory is scanned here otherwise)
+        pending_reads: Reads of the channel files already started with
+            _submit_reads (the files are read here otherwise)
+        use_cache: Use and refresh parsed-sample cache files
 
     Returns:
         Path to created LabChart file, or None if failed
@@ -143,8 +435,10 @@ def convert_directory(
     dir_name = os.path.basename(input_dir)
     print(f"\nProcessing: {dir_name}")
 
-    # Find all channel files
-    channel_files = find_channel_files(input_dir)
+    # Find all channel files (with their stat results)
+    if scanned_files is None:
+        scanned_files = _scan_channel_files(input_dir)
+    channel_files = _channel_paths(scanned_files)
 
     if not channel_files:
         print(f"  Warning: No E{{channel}}.txt files found in {input_dir}")
@@ -153,9 +447,11 @@ def convert_directory(
     print(f"  Found {len(channel_files)} channel files: {sorted(channel_files.keys())}")
 
     # Load all channel data with per-channel sample rates
-    channel_data = load_channel_data(
-        channel_files=channel_files,
-        interval_length=interval_length,
+    channel_data = _load_channels(
+        scanned_files,
+        interval_length,
+        pending_reads=pending_reads,
+        use_cache=use_cache,
     )
 
     if not channel_data:
@@ -164,34 +460,105 @@ def convert_directory(
 
     # Extract session timestamp from directory name (session_{timestamp})
     # Fallback to file modification time if extraction fails
-    session_pattern = re.compile(r"session_(\d{10})")
-    match = session_pattern.match(dir_name)
+    if session_timestamp is None:
+        session_timestamp = _session_timestamp(dir_name)
 
-    if match:
-        timestamp = int(match.group(1))
-        creation_date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    if session_timestamp is not None:
+        creation_date = datetime.fromtimestamp(session_timestamp).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
     else:
-        # Fallback to first file modification time
-        first_file = list(channel_files.values())[0]
-        file_mtime = os.path.getmtime(first_file)
-        creation_date = datetime.fromtimestamp(file_mtime).strftime("%Y-%m-%d %H:%M:%S")
+        # Fallback to first file modification time (already known from the scan)
+        _, file_stat = next(iter(scanned_files.values()))
+        creation_date = datetime.fromtimestamp(file_stat.st_mtime).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
 
     # Create output filename based on directory name
     output_file = os.path.join(output_dir, f"{dir_name}.txt")
 
-    # Export to unified LabChart format
+    # Export to unified LabChart format through one large-buffered binary file
     try:
-        exporter.export_multi_channel(
-            output_file=output_file,
-            channel_data=channel_data,
-            creation_date=creation_date,
-        )
-        print(f"  -> Created {os.path.basename(output_file)}")
-        return output_file
+        stream = open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE)
+    except OSError as e:
+        print(f"  Error creating LabChart file: {e}")
+        return None
+    try:
+        with stream:
+            rows = exporter.export_multi_channel_to_stream(
+                stream, channel_data, creation_date
+            )
     except Exception as e:
         print(f"  Error creating LabChart file: {e}")
+        # Don't leave a partial file behind
+        with contextlib.suppress(OSError):
+            os.remove(output_file)
         return None
 
+    print(f"Exported {rows} samples for {len(channel_data)} channels to {output_file}")
+    print(f"  -> Created {os.path.basename(output_file)}")
+    return output_file
+
+
+# Exporter shared by all tasks in a worker process (set by _init_worker)
+_EXPORTER: Optional[LabChartExporter] = None
+
+
+def _init_worker(exporter_kwargs: Dict[str, Any]) -> None:
+    """
+    Build the exporter once per worker process.
+
+    Args:
+        exporter_kwargs: Keyword arguments for LabChartExporter
+    """
+    global _EXPORTER
+    _EXPORTER = LabChartExporter(**exporter_kwargs)
+
+
+def _convert_directory_worker(
+    input_dir: str,
+    output_dir: str,
+    interval_length: float,
+    session_timestamp: Optional[int] = None,
+    scanned_files: Optional[Dict[int, Tuple[str, os.stat_result]]] = None,
+    use_cache: bool = False,
+) -> Tuple[Optional[str], str]:
+    """
+    Convert a single session directory in a worker process.
+
+    Uses the per-worker exporter created by _init_worker so the exporter is
+    neither pickled nor rebuilt for every task. Progress messages are
+    buffered and returned so the parent can print each directory's log as
+    one block instead of interleaving output from several workers.
+
+    Args:
+        input_dir: Session directory containing E{channel}.txt files
+        output_dir: Output directory for LabChart file
+        interval_length: Length of each interval in seconds
+        session_timestamp: Session timestamp if already known
+        scanned_files: Channel files from the parent's directory scan
+        use_cache: Use and refresh parsed-sample cache files
+
+    Returns:
+        Tuple of (path to created LabChart file or None, buffered log text)
+    """
+    if _EXPORTER is None:
+        raise RuntimeError("Worker exporter not initialized")
+
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        output_file = convert_directory(
+            input_dir=input_dir,
+            output_dir=output_dir,
+            exporter=_EXPORTER,
+            interval_length=interval_length,
+            session_timestamp=session_timestamp,
+            scanned_files=scanned_files,
+            use_cache=use_cache,
+        )
+
+    return output_file, log.getvalue()
+
 
 def bulk_convert(
     input_dir: str,
@@ -204,6 +571,8 @@ def bulk_convert(
     value_in_uV: bool = False,
     absolute_time: bool = False,
     glitch_threshold: int = 500,
+    max_workers: Optional[int] = None,
+    use_cache: bool = False,
 ) -> List[str]:
     """
     Bulk convert all session directories to unified LabChart format.
@@ -223,17 +592,32 @@ def bulk_convert(
         value_in_uV: Express voltage in microvolts
         absolute_time: Use absolute UNIX time
         glitch_threshold: Glitch filter threshold (0 to disable)
+        max_workers: Number of worker processes (default: CPU count, 1 for serial)
+        use_cache: Cache parsed samples next to each E{channel}.txt file
+            (as E{channel}.txt.samples) so re-runs with different export
+            options skip text parsing; stale caches are detected by the
+            source file's size and modification time
 
     Returns:
-        List of created LabChart file paths
+        List of created LabChart file paths, in chronological order
     """
-    # Validate input directory
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory not found: {input_dir}")
+    # Validate input directory (one stat call covers existence and type)
+    try:
+        input_mode = os.stat(input_dir).st_mode
+    except OSError:
+        raise FileNotFoundError(f"Input directory not found: {input_dir}") from None
 
-    if not os.path.isdir(input_dir):
+    if not stat.S_ISDIR(input_mode):
         raise NotADirectoryError(f"Input path is not a directory: {input_dir}")
 
+    # Find all channel directories (with their session timestamps) before
+    # touching the filesystem, so empty inputs leave nothing behind
+    session_dirs = _find_session_directories(input_dir)
+    if not session_dirs:
+        print(f"No subdirectories with E{{channel}}.txt files found in {input_dir}")
+        print(f"Expected structure: {input_dir}/[subdirectory]/E1.txt, E2.txt, etc.")
+        return []
+
     # Set default output directory
     if output_dir is None:
         output_dir = input_dir + "_labchart"
@@ -241,43 +625,81 @@ def bulk_convert(
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    # Find all channel directories
-    channel_dirs = find_channel_directories(input_dir)
-    if not channel_dirs:
-        print(f"No subdirectories with E{{channel}}.txt files found in {input_dir}")
-        print(f"Expected structure: {input_dir}/[subdirectory]/E1.txt, E2.txt, etc.")
-        return []
-
-    print(f"Found {len(channel_dirs)} directories with channel files")
+    print(f"Found {len(session_dirs)} directories with channel files")
     print(f"Output directory: {output_dir}")
 
-    # Create exporter
-    exporter = LabChartExporter(
-        sample_rate=sample_rate,
-        range_mV=range_mV,
-        use_commas=use_commas,
-        time_in_ms=time_in_ms,
-        value_in_uV=value_in_uV,
-        absolute_time=absolute_time,
-        glitch_threshold=glitch_threshold,
-    )
-
-    # Process each directory
-    created_files = []
-    for channel_dir in channel_dirs:
-        output_file = convert_directory(
-            input_dir=channel_dir,
-            output_dir=output_dir,
-            exporter=exporter,
-            interval_length=interval_length,
-        )
-
-        if output_file:
-            created_files.append(output_file)
+    exporter_kwargs: Dict[str, Any] = {
+        "sample_rate": sample_rate,
+        "range_mV": range_mV,
+        "use_commas": use_commas,
+        "time_in_ms": time_in_ms,
+        "value_in_uV": value_in_uV,
+        "absolute_time": absolute_time,
+        "glitch_threshold": glitch_threshold,
+    }
+
+    # Each session directory is independent, so spread them across processes
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = max(1, min(max_workers, len(session_dirs)))
+
+    results: List[Optional[str]] = [None] * len(session_dirs)
+    if workers == 1:
+        exporter = LabChartExporter(**exporter_kwargs)
+        with ThreadPoolExecutor(max_workers=_READ_AHEAD_THREADS) as read_pool:
+            next_reads = _submit_reads(read_pool, session_dirs[0][2], use_cache)
+            for index, (timestamp, channel_dir, scanned) in enumerate(session_dirs):
+                pending_reads = next_reads
+
+                # Start reading the next session's files so that its disk I/O
+                # overlaps with parsing and exporting this one
+                if index + 1 < len(session_dirs):
+                    next_scanned = session_dirs[index + 1][2]
+                    next_reads = _submit_reads(read_pool, next_scanned, use_cache)
+
+                results[index] = convert_directory(
+                    input_dir=channel_dir,
+                    output_dir=output_dir,
+                    exporter=exporter,
+                    interval_length=interval_length,
+                    session_timestamp=timestamp,
+                    scanned_files=scanned,
+                    pending_reads=pending_reads,
+                    use_cache=use_cache,
+                )
+    else:
+        print(f"Using {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(exporter_kwargs,),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _convert_directory_worker,
+                    channel_dir,
+                    output_dir,
+                    interval_length,
+                    timestamp,
+                    scanned,
+                    use_cache,
+                ): index
+                for index, (timestamp, channel_dir, scanned) in enumerate(session_dirs)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index], log_text = future.result()
+                except Exception as e:
+                    print(f"  Error processing {session_dirs[index][1]}: {e}")
+                else:
+                    sys.stdout.write(log_text)
+
+    created_files = [output_file for output_file in results if output_file]
 
     print(f"\nConversion complete!")
     print(
-        f"Successfully converted {len(created_files)} out of {len(channel_dirs)} directories"
+        f"Successfully converted {len(created_files)} out of {len(session_dirs)} directories"
     )
     print(f"Output files: {output_dir}")
 
@@ -389,6 +811,22 @@ Notes:
         help="Glitch filter threshold (0 to disable, default: 500)",
     )
 
+    parser.add_argument(
+        "--workers",
+        "-w",
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, 1 for serial)",
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache parsed samples next to the input files to speed up re-runs",
+    )
+
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -405,6 +843,8 @@ Notes:
             value_in_uV=args.microvolts,
             absolute_time=args.absolute_time,
             glitch_threshold=args.glitch_threshold,
+            max_workers=args.workers,
+            use_cache=args.cache,
         )
 
         if args.verbose:
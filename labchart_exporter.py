@@ -6,10 +6,40 @@ Based on LabChart_Exporter_V4.tcl from:
 https://www.opensourceinstruments.com/Electronics/A3018/Processor_Library.html
 """
 
+import math
 import os
 import struct
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import repeat
+from typing import IO, BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Write buffer for LabChart output files (default io buffer is only 8 KiB)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Number of formatted data rows joined into each write call (~1 MB of text
+# for a typical multi-channel row)
+ROWS_PER_WRITE = 16384
+
+
+class _VoltageText(dict):
+    """
+    Cache of formatted voltage text keyed by raw sample value (counts).
+
+    Samples are 16-bit counts, so a recording only ever needs a few thousand
+    distinct strings; each is formatted on first use and looked up after that.
+    """
+
+    def __init__(self, mV_per_count: float, value_scale: float, value_spec: str):
+        super().__init__()
+        self._mV_per_count = mV_per_count
+        self._value_scale = value_scale
+        self._value_spec = value_spec
+
+    def __missing__(self, counts: float) -> str:
+        voltage = counts * self._mV_per_count
+        text = format(voltage * self._value_scale, self._value_spec)
+        self[counts] = text
+        return text
 
 
 class LabChartExporter:
@@ -46,87 +76,106 @@ class LabChartExporter:
         self.absolute_time = absolute_time
         self.glitch_threshold = glitch_threshold
         self.start_time: Optional[float] = None  # Will be set on first file creation
+        self._offsets: List[float] = []  # Cached sample time offsets
+
+        # Output units are fixed for the exporter's lifetime, so resolve the
+        # scale factors and format specs once instead of branching per value
+        self._time_scale = 1000.0 if time_in_ms else 1.0
+        self._time_spec = ".3f" if time_in_ms else ".6f"
+        self._value_scale = 1000.0 if value_in_uV else 1.0
+        self._value_spec = ".1f" if value_in_uV else ".4f"
+        self._voltage_text = _VoltageText(
+            self.mV_per_count, self._value_scale, self._value_spec
+        )
+        self._second_fractions = self._build_second_fractions()
 
     def _format_value(self, value: float, is_time: bool = False) -> str:
         """Format a numeric value according to settings."""
         if is_time:
-            if self.time_in_ms:
-                formatted = f"{value * 1000.0:.3f}"
-            else:
-                formatted = f"{value:.6f}"
+            formatted = format(value * self._time_scale, self._time_spec)
         else:
-            if self.value_in_uV:
-                formatted = f"{value * 1000.0:.1f}"
-            else:
-                formatted = f"{value:.4f}"
+            formatted = format(value * self._value_scale, self._value_spec)
 
         if self.use_commas:
             formatted = formatted.replace(".", ",")
 
         return formatted
 
-    def _init_file(
-        self, filename: str, channel_num: int, creation_date: Optional[str] = None
-    ) -> None:
+    def _file_header(self, channel_num: int, creation_date: Optional[str]) -> str:
         """
-        Initialize a LabChart export file with header information.
+        Build the single-channel LabChart header.
 
         Args:
-            filename: Path to output file
             channel_num: Channel number
             creation_date: Creation date string (if None, uses "Unknown")
+
+        Returns:
+            Header text, one setting per line
         """
-        with open(filename, "w") as f:
-            # Write interval (time between samples)
-            if self.time_in_ms:
-                interval = 1000.0 / self.sample_rate
-            else:
-                interval = 1.0 / self.sample_rate
-            f.write(f"Interval= {interval}\n")
+        # Interval (time between samples)
+        if self.time_in_ms:
+            interval = 1000.0 / self.sample_rate
+        else:
+            interval = 1.0 / self.sample_rate
+        lines = [f"Interval= {interval}\n"]
 
-            # Write creation date
-            if creation_date:
-                f.write(f"DateTime= {creation_date}\n")
-            else:
-                f.write("DateTime= Unknown\n")
+        # Creation date
+        if creation_date:
+            lines.append(f"DateTime= {creation_date}\n")
+        else:
+            lines.append("DateTime= Unknown\n")
 
-            # TimeFormat (specification unknown, left blank)
-            f.write("TimeFormat= \n")
+        # TimeFormat (specification unknown, left blank)
+        lines.append("TimeFormat= \n")
 
-            # Channel title
-            f.write(f"ChannelTitle= {channel_num}\n")
+        # Channel title
+        lines.append(f"ChannelTitle= {channel_num}\n")
 
-            # Range
-            if self.value_in_uV:
-                range_val = self.range_mV * 1000.0
-            else:
-                range_val = self.range_mV
-            f.write(f"Range= {range_val:.1f}\n")
+        # Range
+        if self.value_in_uV:
+            range_val = self.range_mV * 1000.0
+        else:
+            range_val = self.range_mV
+        lines.append(f"Range= {range_val:.1f}\n")
 
-    def _apply_glitch_filter(self, values: List[int]) -> List[int]:
+        return "".join(lines)
+
+    def _apply_glitch_filter(self, values: Sequence[int]) -> Sequence[int]:
         """
         Apply glitch filter to remove single-sample spikes.
 
         Args:
-            values: List of 16-bit sample values
+            values: Sequence (list or array) of 16-bit sample values
 
         Returns:
-            Filtered list of sample values
+            Filtered sample values; the input sequence itself is returned
+            (not a copy) when no sample needs replacing, so callers must not
+            modify the result in place
         """
         if self.glitch_threshold == 0 or len(values) < 3:
             return values
 
-        filtered = values.copy()
-        for i in range(1, len(values) - 1):
-            # Check if current sample is a glitch (differs greatly from neighbors)
-            diff_prev = abs(values[i] - values[i - 1])
-            diff_next = abs(values[i] - values[i + 1])
+        threshold = self.glitch_threshold
 
-            if diff_prev > self.glitch_threshold and diff_next > self.glitch_threshold:
+        # No neighbouring step can exceed the signal's own range, so a quiet
+        # interval is ruled out by two C-level scans instead of the loop below
+        if max(values) - min(values) <= threshold:
+            return values
+
+        # Copied only once the first glitch is found
+        filtered: Optional[List[int]] = None
+
+        # Walk (previous, current, next) triples without per-sample indexing
+        triples = zip(values, values[1:], values[2:])
+        for i, (prev, current, nxt) in enumerate(triples, 1):
+            # Check if current sample is a glitch (differs greatly from neighbors)
+            if abs(current - prev) > threshold and abs(current - nxt) > threshold:
+                if filtered is None:
+                    filtered = list(values)
                 # Replace glitch with average of neighbors
-                filtered[i] = (values[i - 1] + values[i + 1]) // 2
+                filtered[i] = (prev + nxt) // 2
 
-        return filtered
+        return values if filtered is None else filtered
 
     def export_interval(
         self,
@@ -139,6 +188,11 @@ class LabChartExporter:
         """
         Export a single interval of data to LabChart format.
 
+        Each call opens the file and checks whether it exists, so a file that
+        was deleted or rotated since the last call starts again with a header.
+        To write many intervals to one file, use export_channel, which opens
+        it once.
+
         Args:
             filename: Output file path
             channel_num: Channel number
@@ -149,12 +203,60 @@ class LabChartExporter:
         Returns:
             Number of samples exported
         """
-        # Initialize file if it doesn't exist
-        if not os.path.exists(filename):
-            self._init_file(filename, channel_num, creation_date)
+        # Append to file with a single write for the whole interval
+        with self._open_channel_file(
+            filename, channel_num, creation_date, interval_start_time
+        ) as f:
+            return self._write_interval(f, signal_values, interval_start_time)
+
+    def _open_channel_file(
+        self,
+        filename: str,
+        channel_num: int,
+        creation_date: Optional[str],
+        first_start_time: float,
+        buffering: int = -1,
+    ) -> IO[str]:
+        """
+        Open a single-channel LabChart file for appending data rows.
+
+        A file that doesn't exist yet is created and gets its header through
+        the same handle, so no separate open is needed to initialize it. The
+        existence check runs on every call, so a file deleted or rotated
+        between calls gets its header again.
+
+        Args:
+            filename: Output file path
+            channel_num: Channel number (for the header)
+            creation_date: Archive creation date (for the header)
+            first_start_time: Start time of the first interval to be written
+            buffering: Buffer size passed to open()
+
+        Returns:
+            Text file object positioned at the end of the file
+        """
+        is_new = not os.path.exists(filename)
+        f = open(filename, "w" if is_new else "a", buffering=buffering)
+        if is_new:
+            f.write(self._file_header(channel_num, creation_date))
             if not self.absolute_time:
-                self.start_time = interval_start_time
+                self.start_time = first_start_time
+        return f
 
+    def _write_interval(
+        self, f: IO[str], signal_values: Sequence[int], interval_start_time: float
+    ) -> int:
+        """
+        Format one interval of samples and write it to an open file.
+
+        Args:
+            f: Text file opened for writing, positioned after the header
+            signal_values: Sequence of 16-bit sample values (counts)
+            interval_start_time: Start time of this interval
+
+        Returns:
+            Number of samples written
+        """
         # Apply glitch filter if enabled
         filtered_values = self._apply_glitch_filter(signal_values)
 
@@ -166,38 +268,110 @@ class LabChartExporter:
                 self.start_time = interval_start_time
             start_time = interval_start_time - self.start_time
 
-        # Generate export data
-        export_lines = []
-        sample_time = start_time
-        sample_period = 1.0 / self.sample_rate
+        # Time and voltage (mV or uV) text for each sample
+        time_texts = self._time_texts(start_time, len(filtered_values))
+        voltage_texts = map(self._voltage_text.__getitem__, filtered_values)
+        export_lines = [
+            f"{time_str} {voltage_str}\n"
+            for time_str, voltage_str in zip(time_texts, voltage_texts)
+        ]
 
-        for value in filtered_values:
-            # Convert to millivolts (or microvolts)
-            voltage = value * self.mV_per_count
+        # Decimal commas are applied to the whole interval at once
+        text = "".join(export_lines)
+        if self.use_commas:
+            text = text.replace(".", ",")
 
-            # Format time and voltage
-            time_str = self._format_value(sample_time, is_time=True)
-            voltage_str = self._format_value(voltage, is_time=False)
+        f.write(text)
+        return len(filtered_values)
 
-            export_lines.append(f"{time_str} {voltage_str}\n")
-            sample_time += sample_period
+    def _time_texts(self, start_time: float, count: int) -> List[str]:
+        """
+        Format the times of count samples starting at start_time.
 
-        # Append to file
-        with open(filename, "a") as f:
-            f.writelines(export_lines)
+        Args:
+            start_time: Time of the first sample in seconds
+            count: Number of samples
 
-        return len(filtered_values)
+        Returns:
+            Time text for each sample, possibly followed by extra entries
+        """
+        fractions = self._second_fractions
+        if fractions and float(start_time).is_integer() and start_time >= 0:
+            # Whole seconds plus the cached text of the offset within the
+            # second; with a power-of-two rate the float sum is exact, so this
+            # matches formatting each time, as long as the sum stays exact
+            per_second = len(fractions)
+            first = int(start_time)
+            last = first + -(-count // per_second)
+            if last < (1 << 53) // per_second:
+                return [
+                    f"{second}{fraction}"
+                    for second in range(first, last)
+                    for fraction in fractions
+                ]
+
+        # Sample times are start + i * period rather than a running sum, which
+        # drifts for periods that are not exact binary fractions; the offsets
+        # are computed once and reused for every interval
+        time_scale, time_spec = self._time_scale, self._time_spec
+        return [
+            format((start_time + offset) * time_scale, time_spec)
+            for offset in self._sample_offsets(count)[:count]
+        ]
+
+    def _build_second_fractions(self) -> Optional[List[str]]:
+        """
+        Precompute the fractional time text of each sample within a second.
+
+        Only possible for times in seconds at an integral power-of-two sample
+        rate, where every offset i / sample_rate is an exact binary fraction.
+        Rates above 65536 Hz are left to per-sample formatting rather than
+        caching a very long table.
+
+        Returns:
+            Text after the integer part (".001953", ...) for each sample of a
+            second, or None if times must be formatted one by one
+        """
+        rate = self.sample_rate
+        if self._time_scale != 1.0 or not 1 <= rate <= 65536:
+            return None
+        if math.frexp(rate)[0] != 0.5:
+            return None
+
+        sample_period = 1.0 / rate
+        fractions = [
+            format(i * sample_period, self._time_spec) for i in range(int(rate))
+        ]
+        # Offsets that round up to the next second would need a carry
+        if not all(text.startswith("0.") for text in fractions):
+            return None
+        return [text[1:] for text in fractions]
+
+    def _sample_offsets(self, count: int) -> List[float]:
+        """
+        Return the time offsets (i / sample_rate) of the first count samples.
+
+        The list is cached and only grows, so callers may receive more offsets
+        than they asked for.
+        """
+        if len(self._offsets) < count:
+            sample_period = 1.0 / self.sample_rate
+            self._offsets = [i * sample_period for i in range(count)]
+        return self._offsets
 
     def export_channel(
         self,
         output_dir: str,
         channel_num: int,
-        intervals: List[Tuple[float, List[int]]],
+        intervals: Sequence[Tuple[float, Sequence[int]]],
         creation_date: Optional[str] = None,
     ) -> str:
         """
         Export all intervals for a channel to a LabChart file.
 
+        An existing file is appended to, as with export_interval; a new file
+        gets a header first. The file is opened once for all intervals.
+
         Args:
             output_dir: Directory for output files
             channel_num: Channel number
@@ -210,11 +384,16 @@ class LabChartExporter:
         filename = os.path.join(output_dir, f"E{channel_num}.txt")
 
         total_samples = 0
-        for start_time, signal_values in intervals:
-            count = self.export_interval(
-                filename, channel_num, signal_values, start_time, creation_date
-            )
-            total_samples += count
+        if intervals:
+            with self._open_channel_file(
+                filename,
+                channel_num,
+                creation_date,
+                intervals[0][0],
+                buffering=OUTPUT_BUFFER_SIZE,
+            ) as f:
+                for start_time, signal_values in intervals:
+                    total_samples += self._write_interval(f, signal_values, start_time)
 
         print(
             f"Exported {total_samples} samples for channel {channel_num} to {filename}"
@@ -243,59 +422,101 @@ class LabChartExporter:
         Returns:
             Path to created file
         """
-        if not channel_data:
-            raise ValueError("No channel data provided")
+        # Validate before creating the file so bad input leaves nothing behind
+        channels = self._validate_channel_data(channel_data)
 
-        # Get all channel numbers sorted
-        channels = sorted(channel_data.keys())
+        with open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+            total_samples = self._write_multi_channel(
+                stream, channel_data, channels, creation_date
+            )
 
-        # Verify all channels have data
-        for channel in channels:
-            if not channel_data[channel]:
-                raise ValueError(f"Channel {channel} has no data")
+        print(
+            f"Exported {total_samples} samples for {len(channels)} channels to {output_file}"
+        )
+        return output_file
+
+    def export_multi_channel_to_stream(
+        self,
+        stream: BinaryIO,
+        channel_data: dict,
+        creation_date: Optional[str] = None,
+    ) -> int:
+        """
+        Write multiple channels in unified LabChart format to a binary stream.
+
+        The header and all data rows are written to the stream, which the caller
+        owns (open it in binary mode, ideally with a large buffer).
+
+        Args:
+            stream: Writable binary stream
+            channel_data: Dictionary mapping channel numbers to their intervals
+                         Format: {channel_num: [(start_time, signal_values), ...]}
+            creation_date: Archive creation date
+
+        Returns:
+            Number of rows (unique timestamps) written
+        """
+        channels = self._validate_channel_data(channel_data)
+        return self._write_multi_channel(stream, channel_data, channels, creation_date)
+
+    def _write_multi_channel(
+        self,
+        stream: BinaryIO,
+        channel_data: dict,
+        channels: List[int],
+        creation_date: Optional[str] = None,
+    ) -> int:
+        """
+        Write already validated channels in unified LabChart format.
+
+        Args:
+            stream: Writable binary stream
+            channel_data: Dictionary mapping channel numbers to their intervals
+            channels: Sorted channel numbers from _validate_channel_data
+            creation_date: Archive creation date
 
-        # Initialize file with multi-channel header
-        self._init_multi_channel_file(output_file, channels, creation_date)
+        Returns:
+            Number of rows (unique timestamps) written
+        """
+        # Multi-channel header
+        stream.write(
+            self._multi_channel_header(channels, creation_date).encode("utf-8")
+        )
 
         # Build unified timeline
-        # Collect all samples from all channels with their timestamps
-        all_samples = []
+        # One column per channel mapping sample time -> value. Samples are
+        # already in time order within each interval, so columns are filled
+        # with C-level zip/dict updates instead of collecting and sorting a
+        # (time, channel, value) tuple for every sample.
+        columns: List[Dict[float, str]] = []
+        voltage_text = self._voltage_text.__getitem__
 
         for channel in channels:
             # Determine sample rate for this channel
             # Channel 0: 128 Hz (clock signal), others: 512 Hz
             channel_sample_rate = 128.0 if channel == 0 else 512.0
+            sample_period = 1.0 / channel_sample_rate
 
-            intervals = channel_data[channel]
-            for start_time, signal_values in intervals:
+            column: Dict[float, str] = {}
+            for start_time, signal_values in channel_data[channel]:
                 # Apply glitch filter if enabled
                 filtered_values = self._apply_glitch_filter(signal_values)
 
-                # Calculate time for each sample using per-channel sample rate
-                sample_period = 1.0 / channel_sample_rate
-                for i, value in enumerate(filtered_values):
-                    sample_time = start_time + (i * sample_period)
-                    all_samples.append((sample_time, channel, value))
-
-        # Sort by timestamp to ensure proper ordering
-        all_samples.sort(key=lambda x: (x[0], x[1]))
+                # Calculate time for each sample using per-channel sample rate,
+                # rounded to the nanosecond so channels line up despite
+                # floating point error
+                sample_times = [
+                    round(start_time + (i * sample_period), 9)
+                    for i in range(len(filtered_values))
+                ]
+                # Columns hold the voltage text (mV or uV), formatted once per
+                # distinct sample value
+                column.update(zip(sample_times, map(voltage_text, filtered_values)))
 
-        # Group samples by timestamp using rounding for efficiency
-        # Round to nearest nanosecond to handle floating point precision
-        timestamp_groups: Dict[float, Dict[int, int]] = {}
-
-        for sample_time, channel, value in all_samples:
-            # Round timestamp to avoid floating point comparison issues
-            # Use 9 decimal places (nanosecond precision)
-            rounded_time = round(sample_time, 9)
-
-            if rounded_time not in timestamp_groups:
-                timestamp_groups[rounded_time] = {}
-
-            timestamp_groups[rounded_time][channel] = value
+            columns.append(column)
 
         # Write unified data
-        sorted_times = sorted(timestamp_groups.keys())
+        sorted_times = self._unified_timeline(columns)
 
         # Determine start time for relative time mode
         if not self.absolute_time:
@@ -306,77 +527,125 @@ class LabChartExporter:
         else:
             start_time_value = 0.0  # Not used in absolute mode
 
-        with open(output_file, "a") as f:
-            for sample_time in sorted_times:
-                channel_values = timestamp_groups[sample_time]
-
-                # Calculate display time
-                if self.absolute_time:
-                    display_time = sample_time
-                else:
-                    display_time = sample_time - start_time_value
-
-                # Format time
-                time_str = self._format_value(display_time, is_time=True)
-
-                # Build line with all channel values
-                line_parts = [time_str]
-                for channel in channels:
-                    if channel in channel_values:
-                        # Convert to voltage
-                        voltage = channel_values[channel] * self.mV_per_count
-                        voltage_str = self._format_value(voltage, is_time=False)
-                        line_parts.append(voltage_str)
-                    else:
-                        # Missing data - use empty or zero
-                        line_parts.append("")
-
-                f.write("\t".join(line_parts) + "\n")
-
-        total_samples = len(sorted_times)
-        print(
-            f"Exported {total_samples} samples for {len(channels)} channels to {output_file}"
-        )
-        return output_file
+        time_scale = self._time_scale
+        time_spec = self._time_spec
+
+        for block_start in range(0, len(sorted_times), ROWS_PER_WRITE):
+            block_times = sorted_times[block_start : block_start + ROWS_PER_WRITE]
+
+            # Calculate display time
+            if self.absolute_time:
+                time_texts = [format(t * time_scale, time_spec) for t in block_times]
+            else:
+                time_texts = [
+                    format((t - start_time_value) * time_scale, time_spec)
+                    for t in block_times
+                ]
 
-    def _init_multi_channel_file(
-        self, filename: str, channels: List[int], creation_date: Optional[str] = None
-    ) -> None:
+            # Look up each channel's values for the whole block at C speed;
+            # missing data is left empty
+            cells = [map(column.get, block_times, repeat("")) for column in columns]
+            self._write_rows(stream, map("\t".join, zip(time_texts, *cells)))
+
+        return len(sorted_times)
+
+    def _unified_timeline(self, columns: List[Dict[float, str]]) -> List[float]:
         """
-        Initialize a multi-channel LabChart export file with header information.
+        Get the sorted union of sample times across channel columns.
+
+        Usually one channel's timeline already covers every other channel
+        (e.g. the 128 Hz clock channel falls on the 512 Hz grid) and is built
+        in order, so it is used as-is instead of merging and re-sorting all
+        sample times.
 
         Args:
-            filename: Path to output file
-            channels: List of channel numbers
-            creation_date: Creation date string (if None, uses "Unknown")
+            columns: Per-channel mappings of sample time to value
+
+        Returns:
+            Sorted list of unique sample times
         """
-        with open(filename, "w") as f:
-            # Write interval (time between samples)
-            if self.time_in_ms:
-                interval = 1000.0 / self.sample_rate
-            else:
-                interval = 1.0 / self.sample_rate
-            f.write(f"Interval= {interval}\n")
+        densest = max(columns, key=len)
+        timeline = list(densest)
 
-            # Write creation date
-            if creation_date:
-                f.write(f"DateTime= {creation_date}\n")
-            else:
-                f.write("DateTime= Unknown\n")
+        covers_all = all(column.keys() <= densest.keys() for column in columns)
+        if covers_all and timeline == sorted(timeline):
+            return timeline
+
+        return sorted(set().union(*columns))
 
-            # TimeFormat (specification unknown, left blank)
-            f.write("TimeFormat= \n")
+    def _write_rows(self, stream: BinaryIO, rows: Iterable[str]) -> None:
+        """
+        Write a block of formatted data rows with a single write call.
 
-            # Channel titles - comma separated list
-            channel_titles = ", ".join(str(ch) for ch in channels)
-            f.write(f"ChannelTitle= {channel_titles}\n")
+        Rows are given without line endings. Decimal commas are applied to the
+        whole encoded block at once; data rows only contain digits, signs,
+        points and separators.
+        """
+        text = "\n".join(rows)
+        if not text:
+            return
 
-            # Range
-            if self.value_in_uV:
-                range_val = self.range_mV * 1000.0
-            else:
-                range_val = self.range_mV
-            f.write(f"Range= {range_val:.1f}\n")
+        data = (text + "\n").encode("ascii")
+        if self.use_commas:
+            data = data.replace(b".", b",")
+        stream.write(data)
+
+    def _validate_channel_data(self, channel_data: dict) -> List[int]:
+        """
+        Check multi-channel input and return the sorted channel numbers.
+
+        Raises:
+            ValueError: If no channels are given or a channel has no intervals
+        """
+        if not channel_data:
+            raise ValueError("No channel data provided")
+
+        # Get all channel numbers sorted
+        channels = sorted(channel_data.keys())
+
+        # Verify all channels have data
+        for channel in channels:
+            if not channel_data[channel]:
+                raise ValueError(f"Channel {channel} has no data")
+
+        return channels
+
+    def _multi_channel_header(
+        self, channels: List[int], creation_date: Optional[str] = None
+    ) -> str:
+        """
+        Build the header for a multi-channel LabChart export file.
+
+        Args:
+            channels: List of channel numbers
+            creation_date: Creation date string (if None, uses "Unknown")
+
+        Returns:
+            Header lines as a single string
+        """
+        # Interval (time between samples)
+        if self.time_in_ms:
+            interval = 1000.0 / self.sample_rate
+        else:
+            interval = 1.0 / self.sample_rate
+
+        # Channel titles - comma separated list
+        channel_titles = ", ".join(str(ch) for ch in channels)
+
+        # Range
+        if self.value_in_uV:
+            range_val = self.range_mV * 1000.0
+        else:
+            range_val = self.range_mV
+
+        # TimeFormat (specification unknown, left blank)
+        return (
+            f"Interval= {interval}\n"
+            f"DateTime= {creation_date or 'Unknown'}\n"
+            "TimeFormat= \n"
+            f"ChannelTitle= {channel_titles}\n"
+            f"Range= {range_val:.1f}\n"
+        )
 
 
 def example_usage():
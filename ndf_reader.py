@@ -5,11 +5,194 @@ Helper functions to read Neuroplayer NDF (Neuroscience Data Format) files
 and extract signal data for export to LabChart format.
 """
 
+import gzip
+import mmap
 import os
 import re
 import struct
+import sys
+from array import array
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice, repeat
+from operator import gt
+from typing import (
+    Any,
+    AnyStr,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    """Apply a posix_fadvise hint to a whole file, if the platform supports it."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+    except OSError:
+        # Advisory only; some filesystems and file types reject it
+        pass
+
+
+# Lookup tables splitting an identifier byte into channel and message type
+_LOW_NIBBLE = bytes(b & 0x0F for b in range(256))
+_HIGH_NIBBLE = bytes(b >> 4 for b in range(256))
+
+
+def _gather_bytes(
+    data: Union[bytes, memoryview], step: int, start: int, width: int
+) -> bytearray:
+    """
+    Gather a run of bytes from each fixed-size record.
+
+    Args:
+        data: Concatenated records, a whole number of ``step`` bytes long
+        step: Size of each record in bytes
+        start: Byte offset of the run within a record
+        width: Number of bytes to take from each record
+
+    Returns:
+        The runs, record by record
+    """
+    gathered = bytearray(len(data) // step * width)
+    for k in range(width):
+        gathered[k::width] = data[start + k :: step]
+    return gathered
+
+
+def _uint16_column(data: bytes, step: int, start: int, count: int) -> array:
+    """
+    Gather little-endian 16-bit fields from fixed-size records.
+
+    Args:
+        data: Concatenated records, a whole number of ``step`` bytes long
+        step: Size of each record in bytes
+        start: Byte offset of the first field within a record
+        count: Number of consecutive 16-bit fields to take from each record
+
+    Returns:
+        Array of the fields, record by record
+    """
+    column = array("H", _gather_bytes(data, step, start, 2 * count))
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+class _TelemetryMessages:
+    """Telemetry messages stored column by column"""
+
+    def __init__(
+        self,
+        timestamps: memoryview,
+        channels: bytes,
+        message_types: bytes,
+        samples: memoryview,
+    ):
+        """
+        Args:
+            timestamps: 16-bit timestamp of each message
+            channels: Channel number of each message
+            message_types: Message type of each message
+            samples: Two 16-bit samples per message, message by message
+        """
+        self.timestamps = timestamps
+        self.channels = channels
+        self.message_types = message_types
+        self.samples = samples
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def group_by_channel(self) -> Dict[int, "_TelemetryMessages"]:
+        """
+        Split messages that are already ordered by channel into one group each.
+
+        The timestamp and sample columns of each group are memoryview slices
+        of these ones, so nothing is copied.
+
+        Returns:
+            Dictionary mapping channel_id -> messages for that channel
+        """
+        timestamps = self.timestamps
+        samples = self.samples
+        groups: Dict[int, _TelemetryMessages] = {}
+        start = 0
+        for channel_id in sorted(set(self.channels)):
+            end = start + self.channels.count(channel_id)
+            groups[channel_id] = _TelemetryMessages(
+                timestamps=timestamps[start:end],
+                channels=self.channels[start:end],
+                message_types=self.message_types[start:end],
+                samples=samples[2 * start : 2 * end],
+            )
+            start = end
+        return groups
+
+
+class _ChannelIntervals(Sequence[Tuple[float, Sequence[int]]]):
+    """
+    Fixed-length intervals over one channel's samples, built when accessed.
+
+    Only the channel's sample array is held; each interval is sliced from it
+    (and a short final interval padded with its last value) as it is read,
+    so iterating keeps a single interval in memory at a time.
+    """
+
+    def __init__(
+        self,
+        samples: array,
+        samples_per_interval: int,
+        messages_per_interval: int,
+        interval_length: float,
+    ):
+        """
+        Args:
+            samples: All samples of the channel, in timestamp order
+            samples_per_interval: Number of samples in each interval
+            messages_per_interval: Number of whole messages each interval uses
+            interval_length: Length of each interval in seconds
+        """
+        self._samples = samples
+        self._samples_per_interval = samples_per_interval
+        self._step = 2 * messages_per_interval
+        self._interval_length = interval_length
+
+    def __len__(self) -> int:
+        return -(-len(self._samples) // self._step)
+
+    @overload
+    def __getitem__(self, index: int) -> Tuple[float, Sequence[int]]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Tuple[float, Sequence[int]]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[float, Sequence[int]], List[Tuple[float, Sequence[int]]]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("interval index out of range")
+
+        start = index * self._step
+        interval_samples = self._samples[start : start + self._samples_per_interval]
+        if len(interval_samples) < self._samples_per_interval:
+            # Pad with last value
+            last_val = interval_samples[-1]
+            interval_samples.extend(
+                repeat(last_val, self._samples_per_interval - len(interval_samples))
+            )
+        return index * self._interval_length, interval_samples
 
 
 class NDFReader:
@@ -19,15 +202,19 @@ class NDFReader:
     metadata: Dict[str, Any]
     data_start_offset: Optional[int]
     message_size: int
-    _parsed_messages: Optional[Dict[int, List[Dict]]]
+    _parsed_messages: Optional[Dict[int, _TelemetryMessages]]
     _channels_cache: Optional[List[int]]
     _archive_start_time: Optional[int]
     _channel_sample_rates: Dict[int, float]
+    _data: Union[mmap.mmap, bytes]
 
     def __init__(self, filepath: str):
         """
         Initialize NDF reader.
 
+        The file is memory-mapped once and every later read slices the map;
+        call close() to release it early.
+
         Args:
             filepath: Path to NDF file
         """
@@ -39,115 +226,120 @@ class NDFReader:
         self._channels_cache = None  # Cache for available channels
         self._archive_start_time = None  # Unix timestamp from filename
         self._channel_sample_rates = {}  # Per-channel sample rates
+        self._data = self._map_file()
         self._read_metadata()
         self._find_data_section()
         self._extract_archive_start_time()
 
+    def _map_file(self) -> Union[mmap.mmap, bytes]:
+        """Memory-map the NDF file read-only (an empty file maps to b"")"""
+        with open(self.filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # The telemetry is read front to back, so ask for aggressive readahead
+        if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        return mapped
+
+    def close(self) -> None:
+        """Release the memory map of the NDF file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+
     def _read_metadata(self) -> None:
         """Read metadata from NDF file header"""
-        with open(self.filepath, "rb") as f:
-            data = f.read(1024)
-
-            # Parse NDF header
-            if len(data) >= 16:
-                magic = data[0:4]
-                if magic != b" ndf":
-                    print(f"Warning: Unexpected magic bytes: {magic!r}")
-
-                # Extract header values
-                header_vals = struct.unpack("<III", data[4:16])
-                self.metadata["header_values"] = header_vals
-
-            # Find and parse metadata text section
-            try:
-                # Look for metadata markers
-                start_marker = data.find(b"<c>")
-                end_marker = data.find(b"</payload>")
-
-                if start_marker >= 0 and end_marker > start_marker:
-                    meta_text = data[start_marker : end_marker + 10].decode(
-                        "ascii", errors="ignore"
-                    )
-                    self.metadata["raw_metadata"] = meta_text
-
-                    # Extract creation date
-                    if "Date Created:" in meta_text:
-                        start = meta_text.index("Date Created:") + 13
-                        end = meta_text.find(".", start)
-                        if end > start:
-                            date_str = meta_text[start:end].strip()
-                            self.metadata["created"] = date_str
-                        else:
-                            self.metadata["created"] = "Unknown"
-
-                    # Extract creator info
-                    if "Creator:" in meta_text:
-                        start = meta_text.index("Creator:") + 8
-                        end = meta_text.find(".", start)
-                        if end > start:
-                            creator_str = meta_text[start:end].strip()
-                            self.metadata["creator"] = creator_str
-
-            except Exception as e:
-                print(f"Warning: Could not parse metadata: {e}")
-                self.metadata["created"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        data = self._data[:1024]
+
+        # Parse NDF header
+        if len(data) >= 16:
+            magic = data[0:4]
+            if magic != b" ndf":
+                print(f"Warning: Unexpected magic bytes: {magic!r}")
+
+            # Extract header values
+            header_vals = struct.unpack("<III", data[4:16])
+            self.metadata["header_values"] = header_vals
+
+        # Find and parse metadata text section
+        try:
+            # Look for metadata markers
+            start_marker = data.find(b"<c>")
+            end_marker = data.find(b"</payload>")
+
+            if start_marker >= 0 and end_marker > start_marker:
+                meta_text = data[start_marker : end_marker + 10].decode(
+                    "ascii", errors="ignore"
+                )
+                self.metadata["raw_metadata"] = meta_text
+
+                # Extract creation date
+                if "Date Created:" in meta_text:
+                    start = meta_text.index("Date Created:") + 13
+                    end = meta_text.find(".", start)
+                    if end > start:
+                        date_str = meta_text[start:end].strip()
+                        self.metadata["created"] = date_str
+                    else:
+                        self.metadata["created"] = "Unknown"
+
+                # Extract creator info
+                if "Creator:" in meta_text:
+                    start = meta_text.index("Creator:") + 8
+                    end = meta_text.find(".", start)
+                    if end > start:
+                        creator_str = meta_text[start:end].strip()
+                        self.metadata["creator"] = creator_str
+
+        except Exception as e:
+            print(f"Warning: Could not parse metadata: {e}")
+            self.metadata["created"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def _find_data_section(self) -> None:
         """Find the start of telemetry data in the NDF file"""
-        with open(self.filepath, "rb") as f:
-            file_size = f.seek(0, 2)
-            f.seek(0)
+        file_size = len(self._data)
 
-            # Search for telemetry data starting points
-            for offset in [512, 1024, 2048, 4096, 8192, 16384, 20480]:
-                if offset >= file_size:
-                    continue
+        # Search for telemetry data starting points
+        for offset in [512, 1024, 2048, 4096, 8192, 16384, 20480]:
+            if offset >= file_size:
+                continue
 
-                f.seek(offset)
-                test_data = f.read(1024)
+            test_data = self._data[offset : offset + 1024]
 
-                # Check if this region has structured data (not all zeros)
-                non_zero_count = sum(1 for b in test_data if b != 0)
+            # Check if this region has structured data (not all zeros)
+            non_zero_count = len(test_data) - test_data.count(0)
 
-                if non_zero_count > 100:  # Significant data present
-                    # Verify it looks like telemetry messages
-                    if self._validate_telemetry_region(offset):
-                        self.data_start_offset = offset
-                        break
+            if non_zero_count > 100:  # Significant data present
+                # Verify it looks like telemetry messages
+                if self._validate_telemetry_region(offset):
+                    self.data_start_offset = offset
+                    break
 
-            if self.data_start_offset is None:
-                print(
-                    f"Warning: Could not find telemetry data section in {self.filepath}"
-                )
-                self.data_start_offset = 20480  # Default fallback
+        if self.data_start_offset is None:
+            print(f"Warning: Could not find telemetry data section in {self.filepath}")
+            self.data_start_offset = 20480  # Default fallback
 
     def _validate_telemetry_region(self, offset: int) -> bool:
         """Check if a region contains valid telemetry data"""
-        with open(self.filepath, "rb") as f:
-            f.seek(offset)
-
-            # Check first few messages for consistent structure
-            valid_messages = 0
-            for i in range(10):
-                msg = f.read(self.message_size)
-                if len(msg) < self.message_size:
-                    break
+        # Check first few messages for consistent structure
+        region = self._data[offset : offset + 10 * self.message_size]
+        region = region[: len(region) - len(region) % self.message_size]
 
-                # Basic validation: not all zeros, reasonable timestamp values
-                if sum(msg) > 0:
-                    # Extract timestamp (first 2 bytes as 16-bit value)
-                    timestamp = struct.unpack("<H", msg[0:2])[0]
-                    if 1000 < timestamp < 65000:  # Reasonable timestamp range
-                        valid_messages += 1
+        # Basic validation: reasonable timestamp values (first 2 bytes as a
+        # 16-bit value); a timestamp in range also means a non-zero message
+        timestamps = _uint16_column(region, self.message_size, 0, 1)
+        valid_messages: int = sum(1000 < timestamp < 65000 for timestamp in timestamps)
 
-            return valid_messages >= 5
+        return valid_messages >= 5
 
     def read_channel_data(
         self,
         channel_num: int,
         sample_rate: Optional[float] = None,
         message_size: Optional[int] = None,
-    ) -> List[Tuple[float, List[int]]]:
+    ) -> List[Tuple[float, Sequence[int]]]:
         """
         Read signal data for a specific channel.
 
@@ -159,6 +351,30 @@ class NDFReader:
         Returns:
             List of (timestamp, signal_values) tuples for each interval
         """
+        return list(self.iter_channel_data(channel_num, sample_rate, message_size))
+
+    def iter_channel_data(
+        self,
+        channel_num: int,
+        sample_rate: Optional[float] = None,
+        message_size: Optional[int] = None,
+    ) -> Sequence[Tuple[float, Sequence[int]]]:
+        """
+        Read signal data for a specific channel without materializing it.
+
+        Like read_channel_data, but each interval's values are only built
+        when the interval is accessed, so writing intervals as they are
+        iterated never holds more than one interval beyond the channel's
+        samples.
+
+        Args:
+            channel_num: Channel number to read (0-15)
+            sample_rate: Expected sample rate in Hz (if None, auto-detects based on channel)
+            message_size: Size of each telemetry message in bytes (default: 8)
+
+        Returns:
+            Sequence of (timestamp, signal_values) tuples for each interval
+        """
         if message_size is None:
             message_size = self.message_size
 
@@ -185,65 +401,63 @@ class NDFReader:
         channel_messages = grouped_messages[channel_num]
         print(f"Found {len(channel_messages)} messages for channel {channel_num}")
 
-        # Convert messages to signal intervals
+        # Convert messages to signal intervals, built as they are accessed
         intervals = self._messages_to_intervals(channel_messages, sample_rate)
 
         print(f"Created {len(intervals)} intervals")
         return intervals
 
-    def _parse_telemetry_messages(self, message_size: int) -> List[Dict]:
-        """Parse all telemetry messages from the NDF file"""
-        messages = []
+    def _parse_telemetry_messages(self, message_size: int) -> _TelemetryMessages:
+        """
+        Parse all telemetry messages from the NDF file.
 
-        if self.data_start_offset is None:
-            raise ValueError("No telemetry data section found in NDF file")
+        The data region is read once, reordered by channel with a single
+        stable sort, and split into per-field columns with strided slices,
+        instead of unpacking each message into its own dict.
 
-        with open(self.filepath, "rb") as f:
-            f.seek(self.data_start_offset)
-
-            while True:
-                msg_data = f.read(message_size)
-                if len(msg_data) < message_size:
-                    break
+        Args:
+            message_size: Size of each telemetry message in bytes (at least 8)
 
-                try:
-                    # Parse OSI telemetry message format:
-                    # [timestamp_low(1)] [timestamp_high(1)] [identifier(2)] [sample_data(4)]
-                    timestamp_low = msg_data[0]
-                    timestamp_high = msg_data[1]
-                    timestamp = (timestamp_high << 8) | timestamp_low
-
-                    identifier = struct.unpack("<H", msg_data[2:4])[0]
-                    channel_id = identifier & 0x0F  # Lower 4 bits
-                    message_type = (identifier >> 4) & 0x0F  # Next 4 bits
-
-                    # Extract sample data (typically two 16-bit values)
-                    sample1 = struct.unpack("<H", msg_data[4:6])[0]
-                    sample2 = struct.unpack("<H", msg_data[6:8])[0]
-
-                    message = {
-                        "timestamp": timestamp,
-                        "channel": channel_id,
-                        "message_type": message_type,
-                        "samples": [sample1, sample2],
-                        "raw_data": msg_data,
-                    }
-
-                    messages.append(message)
-
-                except struct.error:
-                    # Skip malformed messages
-                    continue
+        Returns:
+            Columns for every complete message in the data section, ordered
+            by channel and in file order within each channel
+        """
+        if self.data_start_offset is None:
+            raise ValueError("No telemetry data section found in NDF file")
 
-        return messages
+        # Read the data section through a view of the map (slicing the map
+        # itself would copy it), dropping any trailing partial message. The
+        # views are released before returning so the map can be closed.
+        start = self.data_start_offset
+        end = max(len(self._data) - (len(self._data) - start) % message_size, start)
+        with memoryview(self._data) as mapped, mapped[start:end] as data:
+            # Keep the first 8 bytes of each message as one 64-bit record so
+            # a message moves as a unit
+            records = array("Q", _gather_bytes(data, message_size, 0, 8))
+
+            # OSI telemetry message format:
+            # [timestamp_low(1)] [timestamp_high(1)] [identifier(2)] [sample_data(4)]
+            # The channel is the low nibble of the identifier, the message type
+            # the next nibble; both live in its first byte.
+            channels = bytes(data[2::message_size]).translate(_LOW_NIBBLE)
+        order = sorted(range(len(records)), key=channels.__getitem__)
+        ordered = array("Q", map(records.__getitem__, order)).tobytes()
+
+        identifiers = ordered[2::8]
+        return _TelemetryMessages(
+            timestamps=memoryview(_uint16_column(ordered, 8, 0, 1)),
+            channels=identifiers.translate(_LOW_NIBBLE),
+            message_types=identifiers.translate(_HIGH_NIBBLE),
+            samples=memoryview(_uint16_column(ordered, 8, 4, 2)),
+        )
 
-    def _parse_and_group_messages(self) -> Dict[int, List[Dict]]:
+    def _parse_and_group_messages(self) -> Dict[int, _TelemetryMessages]:
         """
         Parse all telemetry messages once and group them by channel.
         This optimized method prevents re-parsing the file for each channel.
 
         Returns:
-            Dictionary mapping channel_id -> list of messages for that channel
+            Dictionary mapping channel_id -> messages for that channel
         """
         if self._parsed_messages is not None:
             return self._parsed_messages
@@ -251,13 +465,8 @@ class NDFReader:
         print("Parsing telemetry messages (one-time operation)...")
         all_messages = self._parse_telemetry_messages(self.message_size)
 
-        # Group messages by channel
-        grouped_messages: Dict[int, List[Dict]] = {}
-        for msg in all_messages:
-            channel_id = msg["channel"]
-            if channel_id not in grouped_messages:
-                grouped_messages[channel_id] = []
-            grouped_messages[channel_id].append(msg)
+        # Messages arrive sorted by channel, so each group is a slice
+        grouped_messages = all_messages.group_by_channel()
 
         # Cache the results
         self._parsed_messages = grouped_messages
@@ -271,60 +480,48 @@ class NDFReader:
         return self._parsed_messages
 
     def _messages_to_intervals(
-        self, messages: List[Dict], sample_rate: float, interval_length: float = 1.0
-    ) -> List[Tuple[float, List[int]]]:
-        """Convert telemetry messages to time intervals with signal data"""
+        self,
+        messages: _TelemetryMessages,
+        sample_rate: float,
+        interval_length: float = 1.0,
+    ) -> Sequence[Tuple[float, Sequence[int]]]:
+        """
+        Convert telemetry messages to time intervals with signal data.
+
+        Samples are taken in timestamp order. Each interval is filled from
+        whole messages: any sample beyond the interval length in its last
+        message is dropped, and a short final interval is padded with its
+        last value.
+
+        Args:
+            messages: Messages for one channel
+            sample_rate: Sample rate in Hz
+            interval_length: Length of each interval in seconds
+
+        Returns:
+            Sequence of (timestamp, signal_values) tuples, values as 16-bit
+            arrays built when each interval is accessed
+        """
         if not messages:
             return []
 
-        # Sort messages by timestamp
-        messages.sort(key=lambda m: m["timestamp"])
+        # Sort messages by timestamp, moving each message's two samples as
+        # one 32-bit word; the samples are already in the 16-bit ADC range.
+        # Messages that arrive in order skip the sort and gather entirely.
+        timestamps = messages.timestamps.tolist()
+        if any(map(gt, timestamps, islice(timestamps, 1, None))):
+            order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+            pairs = messages.samples.cast("B").cast("I")
+            samples = array("H", array("I", map(pairs.__getitem__, order)).tobytes())
+        else:
+            samples = array("H", messages.samples.tobytes())
 
-        # Group messages into time intervals
-        intervals = []
+        # Group samples into time intervals of whole messages
         samples_per_interval = int(sample_rate * interval_length)
-
-        # Estimate timing from message timestamps
-        first_timestamp = messages[0]["timestamp"]
-        current_interval_samples = []
-        current_interval_start = 0.0
-
-        for i, msg in enumerate(messages):
-            # Calculate relative time (convert timestamp to seconds)
-            # Timestamp appears to be in some internal units, estimate conversion
-            relative_time = (msg["timestamp"] - first_timestamp) / 1000.0
-
-            # Add samples from this message
-            for sample in msg["samples"]:
-                # Convert from raw ADC counts (OSI uses 16-bit ADC)
-                # Ensure we stay in valid 16-bit range for LabChart
-                sample_value = max(0, min(65535, sample))
-                current_interval_samples.append(sample_value)
-
-            # Check if we should start a new interval
-            if (
-                len(current_interval_samples) >= samples_per_interval
-                or i == len(messages) - 1
-            ):
-
-                if current_interval_samples:
-                    # Pad or trim to exact interval size if needed
-                    if len(current_interval_samples) < samples_per_interval:
-                        # Pad with last value
-                        last_val = current_interval_samples[-1]
-                        while len(current_interval_samples) < samples_per_interval:
-                            current_interval_samples.append(last_val)
-                    elif len(current_interval_samples) > samples_per_interval:
-                        # Trim to size
-                        current_interval_samples = current_interval_samples[
-                            :samples_per_interval
-                        ]
-
-                    intervals.append((current_interval_start, current_interval_samples))
-                    current_interval_start += interval_length
-                    current_interval_samples = []
-
-        return intervals
+        messages_per_interval = max(1, -(-samples_per_interval // 2))
+        return _ChannelIntervals(
+            samples, samples_per_interval, messages_per_interval, interval_length
+        )
 
     def get_creation_date(self) -> str:
         """Get the creation date from metadata"""
@@ -358,14 +555,26 @@ class NDFReader:
         The filename should be in the format Mx.ndf where x is a 10-digit Unix timestamp.
         This timestamp represents the archive start time.
         """
-        filename = os.path.basename(self.filepath)
+        self._archive_start_time = self.parse_archive_start_time(self.filepath)
+
+    @staticmethod
+    def parse_archive_start_time(filepath: str) -> Optional[int]:
+        """
+        Parse the archive start time from an NDF filename without opening it.
+
+        Args:
+            filepath: Path to an NDF file named Mx.ndf
+
+        Returns:
+            Unix timestamp (seconds since epoch) or None if filename doesn't match Mx.ndf pattern
+        """
+        filename = os.path.basename(filepath)
         match = re.match(r"M(\d{10})\.ndf$", filename, re.IGNORECASE)
 
         if match:
-            self._archive_start_time = int(match.group(1))
-        else:
-            # Filename doesn't match expected pattern
-            self._archive_start_time = None
+            return int(match.group(1))
+        # Filename doesn't match expected pattern
+        return None
 
     def get_archive_start_time(self) -> Optional[int]:
         """
@@ -413,15 +622,16 @@ class NDFReader:
         Returns:
             Duration in seconds, or None if data not available
         """
-        if self._parsed_messages is None:
-            self._parse_and_group_messages()
+        if self.data_start_offset is None:
+            raise ValueError("No telemetry data section found in NDF file")
 
-        if not self._parsed_messages:
+        # Every complete message in the data section is counted, so the
+        # count follows from its size without parsing the messages
+        data_size = max(len(self._data) - self.data_start_offset, 0)
+        total_messages = data_size // self.message_size
+        if not total_messages:
             return None
 
-        # Get total message count across all channels
-        total_messages = sum(len(msgs) for msgs in self._parsed_messages.values())
-
         # Each message contains 2 samples
         # Use 512Hz as baseline (most channels)
         # This is an approximation - actual duration may vary per channel
@@ -443,36 +653,34 @@ class SimpleBinarySignalReader:
     @staticmethod
     def read_signal(
         filepath: str, sample_rate: float = 512.0, interval_length: float = 1.0
-    ) -> List[Tuple[float, List[int]]]:
+    ) -> List[Tuple[float, Sequence[int]]]:
         """
         Read a binary file of 16-bit integers and split into intervals.
 
+        Files ending in .gz are decompressed first.
+
         Args:
             filepath: Path to binary file
             sample_rate: Sample rate in Hz
             interval_length: Length of each interval in seconds
 
         Returns:
-            List of (timestamp, signal_values) tuples
+            List of (timestamp, signal_values) tuples, values as 16-bit arrays
         """
         with open(filepath, "rb") as f:
             data = f.read()
+        if filepath.endswith(".gz"):
+            data = gzip.decompress(data)
 
-        # Unpack as 16-bit unsigned integers
-        num_samples = len(data) // 2
-        values = struct.unpack(f"<{num_samples}H", data)
+        # Load as little-endian 16-bit unsigned integers straight into an
+        # array, two bytes per sample instead of a boxed int each; a trailing
+        # odd byte is ignored
+        values = array("H", data[: len(data) - len(data) % 2])
+        if sys.byteorder == "big":
+            values.byteswap()
 
-        # Split into intervals
-        samples_per_interval = int(sample_rate * interval_length)
-        intervals = []
-
-        for i in range(0, len(values), samples_per_interval):
-            interval_values = list(values[i : i + samples_per_interval])
-            if len(interval_values) > 0:
-                timestamp = i / sample_rate
-                intervals.append((timestamp, interval_values))
-
-        return intervals
+        # Split into intervals (array slices)
+        return TextSignalReader.split_intervals(values, sample_rate, interval_length)
 
 
 class TextSignalReader:
@@ -496,17 +704,102 @@ class TextSignalReader:
         Returns:
             List of (timestamp, signal_values) tuples
         """
-        values = []
-        with open(filepath, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    try:
-                        values.append(int(float(line)))
-                    except ValueError:
-                        continue
-
-        # Split into intervals
+        # Parsed as raw bytes, which skips building a decoded copy of the file
+        data = TextSignalReader.read_bytes(filepath)
+
+        return TextSignalReader.parse_signal(data, sample_rate, interval_length)
+
+    @staticmethod
+    def read_bytes(filepath: str) -> bytes:
+        """
+        Read a whole signal file as raw bytes.
+
+        Where posix_fadvise is available, the kernel is told the file will be
+        read sequentially (larger read-ahead) and that its pages can be dropped
+        afterwards, since each channel file is only read once. Files ending in
+        .gz are decompressed.
+
+        Args:
+            filepath: Path to text file
+
+        Returns:
+            File contents
+        """
+        with open(filepath, "rb") as f:
+            _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+            data = f.read()
+            _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+
+        if filepath.endswith(".gz"):
+            data = gzip.decompress(data)
+
+        return data
+
+    @staticmethod
+    def parse_signal(
+        text: AnyStr, sample_rate: float = 512.0, interval_length: float = 1.0
+    ) -> List[Tuple[float, List[int]]]:
+        """
+        Parse text content with one sample value per line.
+
+        Separated from read_signal so callers can read files ahead of time
+        (e.g. on a background thread) and parse them later.
+
+        Args:
+            text: File contents (str, or raw bytes as read in binary mode)
+            sample_rate: Sample rate in Hz
+            interval_length: Length of each interval in seconds
+
+        Returns:
+            List of (timestamp, signal_values) tuples
+        """
+        values = TextSignalReader._parse_values(text)
+        return TextSignalReader.split_intervals(values, sample_rate, interval_length)
+
+    @staticmethod
+    def parse_samples(text: AnyStr) -> array:
+        """
+        Parse text content into one contiguous array of samples.
+
+        Samples within the 16-bit ADC count range (0-65535) are stored in two
+        bytes each; anything else falls back to 64-bit storage. Either way this
+        avoids a boxed Python int per sample, which keeps long multi-channel
+        recordings compact in memory. Use split_intervals() to get interval
+        slices for the exporter.
+
+        Args:
+            text: File contents (str, or raw bytes as read in binary mode)
+
+        Returns:
+            Array of sample values (typecode "H", or "q" if out of range)
+        """
+        # Plain in-range integer lines go straight from int() into the array,
+        # without an intermediate list of Python ints
+        try:
+            return array("H", map(int, TextSignalReader._data_lines(text)))
+        except (ValueError, OverflowError):
+            pass
+
+        values = TextSignalReader._parse_values(text)
+        if not values or (min(values) >= 0 and max(values) <= 65535):
+            return array("H", values)
+        return array("q", values)
+
+    @staticmethod
+    def split_intervals(
+        values: Sequence[int], sample_rate: float = 512.0, interval_length: float = 1.0
+    ) -> List[Tuple[float, Any]]:
+        """
+        Split a flat sequence of samples into fixed-length intervals.
+
+        Args:
+            values: Sample values (list or array; slices keep the same type)
+            sample_rate: Sample rate in Hz
+            interval_length: Length of each interval in seconds
+
+        Returns:
+            List of (timestamp, signal_values) tuples
+        """
         samples_per_interval = int(sample_rate * interval_length)
         intervals = []
 
@@ -518,6 +811,49 @@ class TextSignalReader:
 
         return intervals
 
+    @staticmethod
+    def _data_lines(text: AnyStr) -> List[AnyStr]:
+        """Split text into lines, dropping empty lines and "#" comment lines."""
+        if isinstance(text, bytes):
+            return [ln for ln in text.split(b"\n") if ln and ln[:1] != b"#"]
+        return [ln for ln in text.split("\n") if ln and ln[:1] != "#"]
+
+    @staticmethod
+    def _parse_values(text: AnyStr) -> List[int]:
+        """Parse one integer sample per line, skipping comments and bad lines."""
+        # Fast path: plain integer lines (the ndf_to_text_converter output) are
+        # parsed by int() in a single C-level map instead of a per-line loop
+        data_lines = TextSignalReader._data_lines(text)
+        try:
+            return list(map(int, data_lines))
+        except ValueError:
+            pass
+
+        # Decimal values truncate toward zero, as int(float()) does below
+        try:
+            return list(map(int, map(float, data_lines)))
+        except (ValueError, OverflowError):
+            pass
+
+        if isinstance(text, bytes):
+            lines = text.split(b"\n")
+            comment = b"#"
+        else:
+            lines = text.split("\n")
+            comment = "#"
+
+        # Blank/indented comments or invalid lines: parse line by line
+        values = []
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith(comment):
+                try:
+                    values.append(int(float(line)))
+                except ValueError:
+                    continue
+
+        return values
+
 
 def example_with_synthetic_data():
     """Example showing how to use readers with synthetic data"""
@@ -19,14 +19,36 @@ Features:
 """
 
 import argparse
-import glob
+import contextlib
+import gzip
+import io
+import math
 import os
+import shutil
+import stat
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import chain, repeat
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from ndf_reader import NDFReader
 
+# Write buffer for channel output files (default io buffer is only 8 KiB)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 
 class NDFToTextConverter:
     """Convert NDF files to readable text format"""
@@ -36,18 +58,32 @@ class NDFToTextConverter:
         output_format: str = "simple",
         include_timestamps: bool = False,
         include_metadata: bool = True,
+        compress: bool = False,
     ):
         """
         Initialize the converter.
 
         Args:
-            output_format: Output format ("simple", "detailed", "csv")
+            output_format: Output format ("simple", "detailed", "csv", "binary")
             include_timestamps: Whether to include timestamp information
             include_metadata: Whether to include file metadata in output
+            compress: Whether to gzip-compress the channel files (adds .gz)
         """
         self.output_format = output_format
         self.include_timestamps = include_timestamps
         self.include_metadata = include_metadata
+        self.compress = compress
+
+        # Resolve the writer once rather than per channel
+        writers = {
+            "simple": self._write_simple_format,
+            "detailed": self._write_detailed_format,
+            "csv": self._write_csv_format,
+            "binary": self._write_binary_format,
+        }
+        if output_format not in writers:
+            raise ValueError(f"Unknown output format: {output_format}")
+        self._writer = writers[output_format]
 
     def convert_ndf_file(
         self,
@@ -70,6 +106,7 @@ class NDFToTextConverter:
         """
         print(f"Processing: {os.path.basename(input_file)}")
 
+        reader: Optional[NDFReader] = None
         try:
             # Read NDF file
             reader = NDFReader(input_file)
@@ -93,8 +130,12 @@ class NDFToTextConverter:
                 print(f"  Warning: No valid channels to process")
                 return []
 
+            # Header dates are shared by every channel file of this NDF file
+            creation_date = reader.get_creation_date()
+            conversion_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
             print(f"  Channels: {process_channels}")
-            print(f"  Creation date: {reader.get_creation_date()}")
+            print(f"  Creation date: {creation_date}")
 
             # Create output directory
             os.makedirs(output_dir, exist_ok=True)
@@ -110,7 +151,13 @@ class NDFToTextConverter:
                 )
 
                 output_file = self._convert_channel(
-                    reader, channel, input_file, output_dir, channel_sample_rate
+                    reader,
+                    channel,
+                    input_file,
+                    output_dir,
+                    channel_sample_rate,
+                    creation_date,
+                    conversion_date,
                 )
                 if output_file:
                     created_files.append(output_file)
@@ -121,6 +168,9 @@ class NDFToTextConverter:
         except Exception as e:
             print(f"  Error processing {input_file}: {e}")
             return []
+        finally:
+            if reader is not None:
+                reader.close()
 
     def _convert_channel(
         self,
@@ -129,11 +179,13 @@ class NDFToTextConverter:
         input_file: str,
         output_dir: str,
         sample_rate: float,
+        creation_date: str,
+        conversion_date: str,
     ) -> Optional[str]:
         """Convert a single channel to text format"""
         try:
-            # Read channel data
-            intervals = reader.read_channel_data(channel, sample_rate)
+            # Read channel data; intervals are built as they are written
+            intervals = reader.iter_channel_data(channel, sample_rate)
 
             if not intervals:
                 print(f"    Channel {channel}: No data found")
@@ -141,21 +193,21 @@ class NDFToTextConverter:
 
             # Create output filename using E{channel} naming convention directly in output_dir
             # (No subdirectory - sessions now handle directory structure)
-            output_file = os.path.join(output_dir, f"E{channel}.txt")
-
-            # Write text file based on format
-            if self.output_format == "simple":
-                self._write_simple_format(output_file, intervals, reader, channel)
-            elif self.output_format == "detailed":
-                self._write_detailed_format(output_file, intervals, reader, channel)
-            elif self.output_format == "csv":
-                self._write_csv_format(output_file, intervals, reader, channel)
-            else:
-                raise ValueError(f"Unknown output format: {self.output_format}")
-
-            # Get file statistics
-            total_samples = sum(len(interval[1]) for interval in intervals)
-            file_size = os.path.getsize(output_file)
+            output_file = os.path.join(output_dir, self._channel_file_name(channel))
+
+            # Write text file in the format chosen at construction
+            total_samples, file_size = self._writer(
+                output_file,
+                intervals,
+                reader,
+                channel,
+                sample_rate,
+                creation_date,
+                conversion_date,
+            )
+            if self.compress:
+                # tell() counted uncompressed text; report the size on disk
+                file_size = os.path.getsize(output_file)
 
             print(
                 f"    Channel {channel}: {total_samples:,} samples -> {os.path.basename(output_file)} ({file_size:,} bytes)"
@@ -166,78 +218,367 @@ class NDFToTextConverter:
             print(f"    Channel {channel}: Error - {e}")
             return None
 
-    def _write_simple_format(
-        self, output_file: str, intervals: List, reader: NDFReader, channel: int
+    def _channel_file_name(self, channel: int) -> str:
+        """Name of a channel's file (E{channel}.txt or .bin, plus .gz if compressed)"""
+        extension = ".bin" if self.output_format == "binary" else ".txt"
+        if self.compress:
+            extension += ".gz"
+        return f"E{channel}{extension}"
+
+    def _open_output(self, output_file: str, append: bool = False) -> TextIO:
+        """
+        Open a channel text file for writing, or for appending to it.
+
+        Compressed files use gzip level 1, which keeps compression cheap next
+        to formatting the text. Appending adds another gzip member, and gzip
+        readers decompress consecutive members as one stream.
+
+        Args:
+            output_file: Path to the text file
+            append: Append to the file instead of replacing it
+
+        Returns:
+            Writable text stream
+        """
+        if self.compress:
+            return gzip.open(
+                output_file, "at" if append else "wt", compresslevel=1, encoding="utf-8"
+            )
+        return open(
+            output_file,
+            "a" if append else "w",
+            encoding="utf-8",
+            buffering=OUTPUT_BUFFER_SIZE,
+        )
+
+    def _open_binary_output(
+        self, output_file: str, append: bool = False
+    ) -> Union[BinaryIO, gzip.GzipFile]:
+        """
+        Open a binary channel file for writing, or for appending to it.
+
+        Args:
+            output_file: Path to the binary file
+            append: Append to the file instead of replacing it
+
+        Returns:
+            Writable binary stream
+        """
+        if self.compress:
+            return gzip.open(output_file, "ab" if append else "wb", compresslevel=1)
+        return open(output_file, "ab" if append else "wb", buffering=OUTPUT_BUFFER_SIZE)
+
+    def _append_channel(
+        self, output_file: str, intervals: Sequence[Tuple[float, Sequence[int]]]
     ) -> None:
-        """Write simple format (one sample value per line)"""
-        with open(output_file, "w", encoding="utf-8") as f:
+        """
+        Append the samples of a later file in a session to a channel file.
+
+        Appended samples continue the first file's values: one per line for
+        the text formats, raw 16-bit values for the binary format.
+
+        Args:
+            output_file: Channel file written for the session's first file
+            intervals: Intervals to append
+        """
+        if self.output_format == "binary":
+            with self._open_binary_output(output_file, append=True) as binary_file:
+                for interval_time, samples in intervals:
+                    binary_file.write(_sample_bytes(samples))
+        else:
+            with self._open_output(output_file, append=True) as f:
+                for interval_time, samples in intervals:
+                    f.write(_sample_lines(samples))
+
+    def _metadata_header(
+        self,
+        title: str,
+        row_format: str,
+        reader: NDFReader,
+        channel: int,
+        total_intervals: int,
+        creation_date: str,
+        conversion_date: str,
+    ) -> str:
+        """
+        Build the commented metadata header of a simple or detailed text file.
+
+        Args:
+            title: First header line
+            row_format: Description of each data line
+            reader: Reader of the source NDF file
+            channel: Channel number
+            total_intervals: Number of intervals in the file
+            creation_date: Creation date of the source NDF file
+            conversion_date: Date and time of this conversion
+
+        Returns:
+            Header text, one comment per line
+        """
+        return (
+            f"# {title}\n"
+            f"# Source file: {reader.filepath}\n"
+            f"# Channel: {channel}\n"
+            f"# Creation date: {creation_date}\n"
+            f"# Total intervals: {total_intervals}\n"
+            f"# Conversion date: {conversion_date}\n"
+            "#\n"
+            f"# Format: {row_format}\n"
+            "#\n"
+        )
+
+    def _write_simple_format(
+        self,
+        output_file: str,
+        intervals: Sequence[Tuple[float, Sequence[int]]],
+        reader: NDFReader,
+        channel: int,
+        sample_rate: float,
+        creation_date: str,
+        conversion_date: str,
+    ) -> Tuple[int, int]:
+        """Write simple format (one value per line); returns samples, bytes written"""
+        with self._open_output(output_file) as f:
             # Write metadata header if requested
             if self.include_metadata:
-                f.write(f"# NDF to Text Conversion\n")
-                f.write(f"# Source file: {reader.filepath}\n")
-                f.write(f"# Channel: {channel}\n")
-                f.write(f"# Creation date: {reader.get_creation_date()}\n")
-                f.write(f"# Total intervals: {len(intervals)}\n")
                 f.write(
-                    f"# Conversion date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    self._metadata_header(
+                        "NDF to Text Conversion",
+                        "One sample value per line (16-bit integers)",
+                        reader,
+                        channel,
+                        len(intervals),
+                        creation_date,
+                        conversion_date,
+                    )
                 )
-                f.write("#\n")
-                f.write("# Format: One sample value per line (16-bit integers)\n")
-                f.write("#\n")
 
-            # Write sample values
+            # Write sample values, one string per interval
+            total_samples = 0
             for interval_time, samples in intervals:
-                for sample in samples:
-                    f.write(f"{sample}\n")
+                f.write(_sample_lines(samples))
+                total_samples += len(samples)
+            return total_samples, f.tell()
 
     def _write_detailed_format(
-        self, output_file: str, intervals: List, reader: NDFReader, channel: int
-    ) -> None:
-        """Write detailed format (with timing and interval information)"""
-        with open(output_file, "w", encoding="utf-8") as f:
+        self,
+        output_file: str,
+        intervals: Sequence[Tuple[float, Sequence[int]]],
+        reader: NDFReader,
+        channel: int,
+        sample_rate: float,
+        creation_date: str,
+        conversion_date: str,
+    ) -> Tuple[int, int]:
+        """Write detailed format (with timing); returns samples and bytes written"""
+        with self._open_output(output_file) as f:
             # Write metadata header
             if self.include_metadata:
-                f.write(f"# NDF to Text Conversion - Detailed Format\n")
-                f.write(f"# Source file: {reader.filepath}\n")
-                f.write(f"# Channel: {channel}\n")
-                f.write(f"# Creation date: {reader.get_creation_date()}\n")
-                f.write(f"# Total intervals: {len(intervals)}\n")
                 f.write(
-                    f"# Conversion date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    self._metadata_header(
+                        "NDF to Text Conversion - Detailed Format",
+                        "[interval_time] [sample_index] [sample_value]",
+                        reader,
+                        channel,
+                        len(intervals),
+                        creation_date,
+                        conversion_date,
+                    )
                 )
-                f.write("#\n")
-                f.write("# Format: [interval_time] [sample_index] [sample_value]\n")
-                f.write("#\n")
 
-            # Write detailed information
+            # Write detailed information, one string per interval, joined
+            # from field columns like the CSV rows
+            total_samples = 0
+            index_texts: List[str] = []
             for interval_time, samples in intervals:
+                count = len(samples)
+                if len(index_texts) < count:
+                    index_texts = [f"{i} " for i in range(count)]
                 f.write(f"# Interval start: {interval_time:.6f} seconds\n")
-                for i, sample in enumerate(samples):
-                    if self.include_timestamps:
-                        sample_time = interval_time + (i / 512.0)  # Assume 512 Hz
-                        f.write(f"{sample_time:.6f} {i} {sample}\n")
-                    else:
-                        f.write(f"{interval_time:.6f} {i} {sample}\n")
+                fields: Iterable[Tuple[str, ...]]
+                if self.include_timestamps:
+                    times = _sample_times(interval_time, count, sample_rate)
+                    fields = zip(
+                        times, repeat(" "), index_texts, _sample_texts(samples)
+                    )
+                else:
+                    prefix = f"{interval_time:.6f} "
+                    fields = zip(repeat(prefix), index_texts, _sample_texts(samples))
+                f.write("".join(chain.from_iterable(fields)))
+                total_samples += count
+            return total_samples, f.tell()
 
     def _write_csv_format(
-        self, output_file: str, intervals: List, reader: NDFReader, channel: int
-    ) -> None:
-        """Write CSV format"""
-        with open(output_file, "w", encoding="utf-8") as f:
+        self,
+        output_file: str,
+        intervals: Sequence[Tuple[float, Sequence[int]]],
+        reader: NDFReader,
+        channel: int,
+        sample_rate: float,
+        creation_date: str,
+        conversion_date: str,
+    ) -> Tuple[int, int]:
+        """Write CSV format; returns samples and bytes written"""
+        with self._open_output(output_file) as f:
             # Write CSV header
             if self.include_timestamps:
                 f.write("timestamp,interval_time,sample_index,sample_value\n")
             else:
                 f.write("interval_time,sample_index,sample_value\n")
 
-            # Write data
+            # Write data, one string per interval. Rows are joined from
+            # ready-made field texts at C level rather than formatted one by one.
+            total_samples = 0
+            index_texts: List[str] = []
+            for interval_time, samples in intervals:
+                count = len(samples)
+                if len(index_texts) < count:
+                    index_texts = [f"{i}," for i in range(count)]
+                fields: Iterable[Tuple[str, ...]]
+                if self.include_timestamps:
+                    times = _sample_times(interval_time, count, sample_rate)
+                    suffix = f",{interval_time:.6f},"
+                    fields = zip(
+                        times, repeat(suffix), index_texts, _sample_texts(samples)
+                    )
+                else:
+                    prefix = f"{interval_time:.6f},"
+                    fields = zip(repeat(prefix), index_texts, _sample_texts(samples))
+                f.write("".join(chain.from_iterable(fields)))
+                total_samples += count
+            return total_samples, f.tell()
+
+    def _write_binary_format(
+        self,
+        output_file: str,
+        intervals: Sequence[Tuple[float, Sequence[int]]],
+        reader: NDFReader,
+        channel: int,
+        sample_rate: float,
+        creation_date: str,
+        conversion_date: str,
+    ) -> Tuple[int, int]:
+        """Write raw little-endian 16-bit samples; returns samples, bytes written"""
+        with self._open_binary_output(output_file) as f:
+            # No header: the file is read back with SimpleBinarySignalReader
+            total_samples = 0
             for interval_time, samples in intervals:
-                for i, sample in enumerate(samples):
-                    if self.include_timestamps:
-                        sample_time = interval_time + (i / 512.0)  # Assume 512 Hz
-                        f.write(f"{sample_time:.6f},{interval_time:.6f},{i},{sample}\n")
-                    else:
-                        f.write(f"{interval_time:.6f},{i},{sample}\n")
+                f.write(_sample_bytes(samples))
+                total_samples += len(samples)
+            return total_samples, f.tell()
+
+
+# Text after the integer part of each sample offset within a second, per rate
+_SECOND_FRACTIONS: Dict[float, Optional[List[str]]] = {}
+
+
+def _second_fractions(sample_rate: float) -> Optional[List[str]]:
+    """
+    Return the cached fractional time text of each sample within a second.
+
+    Only integral power-of-two rates up to 65536 Hz have exact binary offsets
+    i / sample_rate whose text can be reused for every second.
+
+    Args:
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Text after the integer part (".001953", ...) for each sample of a
+        second, or None if times must be formatted one by one
+    """
+    if sample_rate not in _SECOND_FRACTIONS:
+        fractions = None
+        if 1 <= sample_rate <= 65536 and math.frexp(sample_rate)[0] == 0.5:
+            texts = [format(i / sample_rate, ".6f") for i in range(int(sample_rate))]
+            # Offsets that round up to the next second would need a carry
+            if all(text.startswith("0.") for text in texts):
+                fractions = [text[1:] for text in texts]
+        _SECOND_FRACTIONS[sample_rate] = fractions
+    return _SECOND_FRACTIONS[sample_rate]
+
+
+# Offsets i / sample_rate of the samples in an interval, per sample rate
+_SAMPLE_OFFSETS: Dict[float, List[float]] = {}
+
+
+def _sample_times(interval_time: float, count: int, sample_rate: float) -> List[str]:
+    """
+    Format the times of count samples starting at interval_time.
+
+    At power-of-two rates the offsets i / sample_rate are exact binary
+    fractions, so for an interval starting on a whole second each time is
+    that second plus a cached fraction text, matching
+    f"{interval_time + i / sample_rate:.6f}" without formatting a float per
+    sample. Other rates add cached offsets, dividing once per rate rather
+    than once per sample.
+
+    Args:
+        interval_time: Start time of the interval in seconds
+        count: Number of samples
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Time text for each sample
+    """
+    fractions = _second_fractions(sample_rate)
+    if fractions and interval_time >= 0 and float(interval_time).is_integer():
+        per_second = len(fractions)
+        first = int(interval_time)
+        last = first + -(-count // per_second)
+        if last < (1 << 53) // per_second:
+            times = [
+                f"{second}{fraction}"
+                for second in range(first, last)
+                for fraction in fractions
+            ]
+            return times[:count]
+
+    offsets = _SAMPLE_OFFSETS.get(sample_rate, [])
+    if len(offsets) < count:
+        offsets = [i / sample_rate for i in range(count)]
+        _SAMPLE_OFFSETS[sample_rate] = offsets
+    return [f"{interval_time + offset:.6f}" for offset in offsets[:count]]
+
+
+# Text of each 16-bit sample value followed by a newline, built on first use
+_SAMPLE_TEXTS: List[str] = []
+
+
+def _sample_texts(samples: Sequence[int]) -> Iterable[str]:
+    """
+    Return each sample's text followed by a newline.
+
+    16-bit arrays, as read from NDF files, are looked up in a table of every
+    possible value instead of converting each integer to text.
+
+    Args:
+        samples: Sample values
+
+    Returns:
+        Text of each sample, newline terminated
+    """
+    if isinstance(samples, array) and samples.typecode == "H":
+        if not _SAMPLE_TEXTS:
+            _SAMPLE_TEXTS.extend(f"{value}\n" for value in range(1 << 16))
+        return map(_SAMPLE_TEXTS.__getitem__, samples)
+    return map("{}\n".format, samples)
+
+
+def _sample_bytes(samples: Sequence[int]) -> bytes:
+    """Encode samples as little-endian unsigned 16-bit values."""
+    if isinstance(samples, array) and samples.typecode == "H":
+        values = samples
+    else:
+        values = array("H", samples)
+    if sys.byteorder == "big":
+        values = array("H", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _sample_lines(samples: Sequence[int]) -> str:
+    """Format samples as text, one value per line (empty for no samples)."""
+    return "".join(_sample_texts(samples))
 
 
 def find_ndf_files(input_path: str) -> List[str]:
@@ -250,22 +591,28 @@ def find_ndf_files(input_path: str) -> List[str]:
     Returns:
         List of NDF file paths
     """
-    if os.path.isfile(input_path):
+    # One stat call tells files, directories and missing paths apart
+    try:
+        input_mode = os.stat(input_path).st_mode
+    except OSError:
+        input_mode = 0
+
+    if stat.S_ISREG(input_mode):
         if input_path.lower().endswith(".ndf"):
             return [input_path]
         else:
             raise ValueError(f"File {input_path} is not an NDF file")
 
-    elif os.path.isdir(input_path):
-        # Find all NDF files in directory
-        pattern = os.path.join(input_path, "*.ndf")
-        ndf_files = glob.glob(pattern)
-
-        # Also check for uppercase extension
-        pattern_upper = os.path.join(input_path, "*.NDF")
-        ndf_files.extend(glob.glob(pattern_upper))
-
-        return sorted(list(set(ndf_files)))  # Remove duplicates and sort
+    elif stat.S_ISDIR(input_mode):
+        # Find all NDF files in directory, any extension case, in one pass
+        with os.scandir(input_path) as entries:
+            return sorted(
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith(".ndf")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            )
 
     else:
         raise FileNotFoundError(f"Path not found: {input_path}")
@@ -287,6 +634,26 @@ def group_ndf_files_into_sessions(
     Returns:
         List of sessions, where each session is a list of NDF file paths in chronological order
     """
+    return [
+        [filepath for _, filepath in session]
+        for session in _group_timed_ndf_files(ndf_files, gap_threshold)
+    ]
+
+
+def _group_timed_ndf_files(
+    ndf_files: List[str], gap_threshold: float
+) -> List[List[Tuple[int, str]]]:
+    """
+    Group NDF files into sessions, keeping each file's start timestamp.
+
+    Args:
+        ndf_files: List of NDF file paths
+        gap_threshold: Maximum time gap in seconds within a session
+
+    Returns:
+        List of sessions, each a list of (timestamp, filepath) tuples
+        in chronological order
+    """
     if not ndf_files:
         return []
 
@@ -297,8 +664,9 @@ def group_ndf_files_into_sessions(
     print(f"Analyzing {len(ndf_files)} files for session grouping...")
 
     for filepath in ndf_files:
-        reader = NDFReader(filepath)
-        timestamp = reader.get_archive_start_time()
+        # The start time comes from the filename, so only files that have
+        # one are opened, and then just for the header to get the duration
+        timestamp = NDFReader.parse_archive_start_time(filepath)
 
         if timestamp is None:
             print(
@@ -306,8 +674,17 @@ def group_ndf_files_into_sessions(
             )
             continue
 
-        # Get duration once while we have the reader
-        duration = reader.get_file_duration()
+        # A file that can't be read is skipped rather than ending the grouping
+        reader: Optional[NDFReader] = None
+        try:
+            reader = NDFReader(filepath)
+            duration = reader.get_file_duration()
+        except Exception as e:
+            print(f"Warning: Cannot read {os.path.basename(filepath)} ({e}), skipping")
+            continue
+        finally:
+            if reader is not None:
+                reader.close()
 
         files_with_data.append((timestamp, duration, filepath))
 
@@ -319,8 +696,8 @@ def group_ndf_files_into_sessions(
     files_with_data.sort(key=lambda x: x[0])
 
     # Group into sessions based on gaps
-    sessions: List[List[str]] = []
-    current_session: List[str] = [files_with_data[0][2]]
+    sessions: List[List[Tuple[int, str]]] = []
+    current_session = [(files_with_data[0][0], files_with_data[0][2])]
 
     for i in range(1, len(files_with_data)):
         prev_timestamp, prev_duration, prev_file = files_with_data[i - 1]
@@ -343,10 +720,10 @@ def group_ndf_files_into_sessions(
             )
             print(f"Starting new session...")
             sessions.append(current_session)
-            current_session = [curr_file]
+            current_session = [(curr_timestamp, curr_file)]
         else:
             # Continue current session
-            current_session.append(curr_file)
+            current_session.append((curr_timestamp, curr_file))
 
     # Don't forget the last session
     sessions.append(current_session)
@@ -358,6 +735,219 @@ def group_ndf_files_into_sessions(
     return sessions
 
 
+def _convert_session(
+    converter: NDFToTextConverter,
+    session_name: str,
+    session_files: List[str],
+    session_output_dir: str,
+    channels: Optional[List[int]] = None,
+    sample_rate: Optional[float] = None,
+) -> List[str]:
+    """
+    Convert the NDF files of one session into its E{channel}.txt files.
+
+    The first file creates the channel files and later files append to
+    them, so a session's files are always processed in order.
+
+    Args:
+        converter: Converter holding the output settings
+        session_name: Session name used in progress messages
+        session_files: NDF files of the session in chronological order
+        session_output_dir: Output directory for the session
+        channels: Specific channels to extract (None for all)
+        sample_rate: Sample rate for processing (None for auto-detect per channel)
+
+    Returns:
+        List of created text file paths
+    """
+    print(f"\nProcessing {session_name} ({len(session_files)} file(s))...")
+
+    # Process files in chronological order within this session
+    session_created_files = []
+
+    for file_idx, ndf_file in enumerate(session_files):
+        print(
+            f"  File {file_idx + 1}/{len(session_files)}: {os.path.basename(ndf_file)}"
+        )
+
+        # For the first file, create new channel files
+        # For subsequent files, append to existing channel files
+        if file_idx == 0:
+            # First file - create new files
+            created_files = converter.convert_ndf_file(
+                input_file=ndf_file,
+                output_dir=session_output_dir,
+                channels=channels,
+                sample_rate=sample_rate,
+            )
+            session_created_files.extend(created_files)
+        else:
+            # Subsequent files - append to existing files
+            _append_ndf_file(
+                converter, ndf_file, session_output_dir, channels, sample_rate
+            )
+
+    return session_created_files
+
+
+def _append_ndf_file(
+    converter: NDFToTextConverter,
+    ndf_file: str,
+    output_dir: str,
+    channels: Optional[List[int]] = None,
+    sample_rate: Optional[float] = None,
+) -> None:
+    """
+    Append the channels of a later NDF file in a session to its channel files.
+
+    Like convert_ndf_file, a file that fails is reported and skipped: what
+    it had already appended is truncated away, so the session continues
+    without it.
+
+    Args:
+        converter: Converter holding the output settings
+        ndf_file: NDF file to append
+        output_dir: Directory holding the session's channel files
+        channels: Specific channels to extract (None for all)
+        sample_rate: Sample rate for processing (None for auto-detect per channel)
+    """
+    reader: Optional[NDFReader] = None
+    # Size of each channel file before this NDF file (None if it was new)
+    previous_sizes: Dict[str, Optional[int]] = {}
+    try:
+        reader = NDFReader(ndf_file)
+        available_channels = reader.get_available_channels()
+
+        # Determine which channels to process
+        if channels is None:
+            process_channels = available_channels
+        else:
+            process_channels = [ch for ch in channels if ch in available_channels]
+
+        os.makedirs(output_dir, exist_ok=True)
+        for channel in process_channels:
+            # Use auto-detected sample rate if not specified
+            channel_sample_rate = (
+                sample_rate
+                if sample_rate is not None
+                else reader.get_channel_sample_rate(channel)
+            )
+
+            # Read channel data; intervals are built as they are written
+            intervals = reader.iter_channel_data(channel, channel_sample_rate)
+
+            if intervals:
+                # Append to existing E{channel} file
+                output_file = os.path.join(
+                    output_dir, converter._channel_file_name(channel)
+                )
+                previous_sizes[output_file] = _file_size(output_file)
+                converter._append_channel(output_file, intervals)
+    except Exception as e:
+        print(f"  Error processing {ndf_file}: {e}")
+        _restore_file_sizes(previous_sizes)
+    finally:
+        if reader is not None:
+            reader.close()
+
+
+def _file_size(path: str) -> Optional[int]:
+    """Return the size of a file, or None if it doesn't exist"""
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return None
+
+
+def _restore_file_sizes(previous_sizes: Dict[str, Optional[int]]) -> None:
+    """
+    Undo appends by truncating files back to their earlier sizes.
+
+    Args:
+        previous_sizes: Size of each file before the appends (None to remove it)
+    """
+    for path, size in previous_sizes.items():
+        if size is None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+        else:
+            os.truncate(path, size)
+
+
+def _convert_file_worker(
+    converter_kwargs: Dict[str, Any],
+    ndf_file: str,
+    output_dir: str,
+    first: bool,
+    channels: Optional[List[int]] = None,
+    sample_rate: Optional[float] = None,
+) -> Tuple[List[str], str]:
+    """
+    Convert one NDF file of a session in a worker process.
+
+    A session's first file creates its channel files in the session
+    directory. A later file is written to its own part directory instead,
+    as the tail that the parent appends to the channel files in order.
+    Progress messages are buffered and returned so the parent can print
+    them in file order instead of interleaving output from several workers.
+
+    Args:
+        converter_kwargs: Keyword arguments for NDFToTextConverter
+        ndf_file: NDF file to convert
+        output_dir: Session directory for the first file, part directory otherwise
+        first: Whether this is the first file of its session
+        channels: Specific channels to extract (None for all)
+        sample_rate: Sample rate for processing (None for auto-detect per channel)
+
+    Returns:
+        Tuple of (created text file paths, buffered log text)
+    """
+    converter = NDFToTextConverter(**converter_kwargs)
+
+    log = io.StringIO()
+    created_files: List[str] = []
+    with contextlib.redirect_stdout(log):
+        if first:
+            created_files = converter.convert_ndf_file(
+                input_file=ndf_file,
+                output_dir=output_dir,
+                channels=channels,
+                sample_rate=sample_rate,
+            )
+        else:
+            _append_ndf_file(converter, ndf_file, output_dir, channels, sample_rate)
+
+    return created_files, log.getvalue()
+
+
+def _merge_channel_parts(part_dir: str, output_dir: str) -> None:
+    """
+    Append the channel files in a part directory to the session's ones.
+
+    The part directory is removed afterwards, also when merging fails, in
+    which case the session's channel files are truncated back first.
+
+    Args:
+        part_dir: Part directory written for a later file of the session
+        output_dir: Session directory holding the channel files
+    """
+    previous_sizes: Dict[str, Optional[int]] = {}
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        for name in sorted(os.listdir(part_dir)):
+            output_file = os.path.join(output_dir, name)
+            previous_sizes[output_file] = _file_size(output_file)
+            with open(os.path.join(part_dir, name), "rb") as src, open(
+                output_file, "ab"
+            ) as dst:
+                shutil.copyfileobj(src, dst, OUTPUT_BUFFER_SIZE)
+    except BaseException:
+        _restore_file_sizes(previous_sizes)
+        raise
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+
 def bulk_convert_ndf_to_text(
     input_path: str,
     output_dir: Optional[str] = None,
@@ -367,6 +957,8 @@ def bulk_convert_ndf_to_text(
     include_metadata: bool = True,
     sample_rate: Optional[float] = None,
     gap_threshold: float = 3600.0,
+    max_workers: Optional[int] = None,
+    compress: bool = False,
 ) -> Dict[str, List[str]]:
     """
     Convert NDF files to text format in bulk with session grouping.
@@ -378,11 +970,13 @@ def bulk_convert_ndf_to_text(
         input_path: Input file or directory path
         output_dir: Output directory (default: input_path + '_text')
         channels: Specific channels to extract (None for all)
-        output_format: Output format ("simple", "detailed", "csv")
+        output_format: Output format ("simple", "detailed", "csv", "binary")
         include_timestamps: Include timestamp information
         include_metadata: Include file metadata
         sample_rate: Sample rate for processing (None for auto-detect per channel)
         gap_threshold: Maximum gap in seconds to consider files part of same session (default: 3600)
+        max_workers: Number of worker processes (default: CPU count, 1 for serial)
+        compress: Write gzip-compressed E{channel}.txt.gz files
 
     Returns:
         Dictionary mapping session names to created output files
@@ -396,9 +990,9 @@ def bulk_convert_ndf_to_text(
     print(f"Found {len(ndf_files)} NDF files")
 
     # Group files into sessions
-    sessions = group_ndf_files_into_sessions(ndf_files, gap_threshold)
+    timed_sessions = _group_timed_ndf_files(ndf_files, gap_threshold)
 
-    if not sessions:
+    if not timed_sessions:
         print("No valid sessions found")
         return {}
 
@@ -411,21 +1005,20 @@ def bulk_convert_ndf_to_text(
 
     print(f"Output directory: {output_dir}")
 
-    # Create converter
-    converter = NDFToTextConverter(
-        output_format=output_format,
-        include_timestamps=include_timestamps,
-        include_metadata=include_metadata,
-    )
-
-    # Convert each session
-    results = {}
-    total_files_created = 0
-
-    for session_num, session_files in enumerate(sessions, 1):
-        # Get session start time from first file
-        first_reader = NDFReader(session_files[0])
-        session_start_time = first_reader.get_archive_start_time()
+    # Converter settings, shared with worker processes
+    converter_kwargs: Dict[str, Any] = {
+        "output_format": output_format,
+        "include_timestamps": include_timestamps,
+        "include_metadata": include_metadata,
+        "compress": compress,
+    }
+
+    # Name each session and its output directory
+    session_jobs = []
+    for session_num, timed_files in enumerate(timed_sessions, 1):
+        # Session start time is the first file's, kept from grouping
+        session_start_time = timed_files[0][0]
+        session_files = [filepath for _, filepath in timed_files]
 
         # Create session directory name
         session_name = f"session_{session_num:03d}"
@@ -434,69 +1027,90 @@ def bulk_convert_ndf_to_text(
             session_name = f"session_{session_start_time}"
 
         session_output_dir = os.path.join(output_dir, session_name)
-
-        print(f"\nProcessing {session_name} ({len(session_files)} file(s))...")
-
-        # Process files in chronological order within this session
-        session_created_files = []
-
-        for file_idx, ndf_file in enumerate(session_files):
-            print(
-                f"  File {file_idx + 1}/{len(session_files)}: {os.path.basename(ndf_file)}"
+        session_jobs.append((session_name, session_files, session_output_dir))
+
+    # Every file is a task for the worker processes. A session's later
+    # files are written to part directories and appended in file order
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    total_files = sum(len(session_files) for _, session_files, _ in session_jobs)
+    workers = max(1, min(max_workers, total_files))
+
+    session_results: List[List[str]] = [[] for _ in session_jobs]
+    if workers == 1:
+        converter = NDFToTextConverter(**converter_kwargs)
+        for index, (session_name, session_files, session_output_dir) in enumerate(
+            session_jobs
+        ):
+            session_results[index] = _convert_session(
+                converter,
+                session_name,
+                session_files,
+                session_output_dir,
+                channels,
+                sample_rate,
             )
-
-            # For the first file, create new channel files
-            # For subsequent files, append to existing channel files
-            if file_idx == 0:
-                # First file - create new files
-                created_files = converter.convert_ndf_file(
-                    input_file=ndf_file,
-                    output_dir=session_output_dir,
-                    channels=channels,
-                    sample_rate=sample_rate,
-                )
-                session_created_files.extend(created_files)
-            else:
-                # Subsequent files - append to existing files
-                # Read the file and append data to existing E{channel}.txt files
-                reader = NDFReader(ndf_file)
-                available_channels = reader.get_available_channels()
-
-                # Determine which channels to process
-                if channels is None:
-                    process_channels = available_channels
-                else:
-                    process_channels = [
-                        ch for ch in channels if ch in available_channels
-                    ]
-
-                for channel in process_channels:
-                    # Use auto-detected sample rate if not specified
-                    channel_sample_rate = (
-                        sample_rate
-                        if sample_rate is not None
-                        else reader.get_channel_sample_rate(channel)
+    else:
+        print(f"Using {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            session_tasks = []
+            for _, session_files, session_output_dir in session_jobs:
+                tasks = []
+                for file_idx, ndf_file in enumerate(session_files):
+                    task_dir = session_output_dir
+                    if file_idx > 0:
+                        # Parts are appended to, so drop any left by an
+                        # interrupted run before the worker writes one
+                        task_dir = os.path.join(session_output_dir, f".part{file_idx}")
+                        shutil.rmtree(task_dir, ignore_errors=True)
+                    future = executor.submit(
+                        _convert_file_worker,
+                        converter_kwargs,
+                        ndf_file,
+                        task_dir,
+                        file_idx == 0,
+                        channels,
+                        sample_rate,
                     )
-
-                    # Read channel data
-                    intervals = reader.read_channel_data(channel, channel_sample_rate)
-
-                    if intervals:
-                        # Append to existing E{channel}.txt file
-                        output_file = os.path.join(
-                            session_output_dir, f"E{channel}.txt"
-                        )
-
-                        with open(output_file, "a", encoding="utf-8") as f:
-                            for interval_time, samples in intervals:
-                                for sample in samples:
-                                    f.write(f"{sample}\n")
-
+                    tasks.append((ndf_file, task_dir, future))
+                session_tasks.append(tasks)
+
+            # Collect in order, so logs and appended parts follow the files
+            for index, (session_name, session_files, session_output_dir) in enumerate(
+                session_jobs
+            ):
+                print(f"\nProcessing {session_name} ({len(session_files)} file(s))...")
+                for file_idx, (ndf_file, task_dir, future) in enumerate(
+                    session_tasks[index]
+                ):
+                    print(
+                        f"  File {file_idx + 1}/{len(session_files)}: "
+                        f"{os.path.basename(ndf_file)}"
+                    )
+                    # A failed file is reported and skipped, as in serial runs
+                    try:
+                        created_files, log_text = future.result()
+                        sys.stdout.write(log_text)
+                        if file_idx == 0:
+                            session_results[index] = created_files
+                        else:
+                            _merge_channel_parts(task_dir, session_output_dir)
+                    except Exception as e:
+                        print(f"  Error processing {ndf_file}: {e}")
+                        if file_idx > 0:
+                            shutil.rmtree(task_dir, ignore_errors=True)
+
+    # Collect results in session order
+    results = {}
+    total_files_created = 0
+    for (session_name, _, _), session_created_files in zip(
+        session_jobs, session_results
+    ):
         results[session_name] = session_created_files
         total_files_created += len(session_created_files)
 
     print(f"\nConversion complete!")
-    print(f"Processed {len(ndf_files)} NDF files in {len(sessions)} session(s)")
+    print(f"Processed {len(ndf_files)} NDF files in {len(timed_sessions)} session(s)")
     print(f"Created {total_files_created} channel files across all sessions")
     print(f"Output directory: {output_dir}")
 
@@ -529,6 +1143,7 @@ Output Formats:
   simple   - One sample value per line (compatible with TextSignalReader)
   detailed - Includes interval and timing information
   csv      - Comma-separated values format
+  binary   - Raw 16-bit samples (E{channel}.bin, read with SimpleBinarySignalReader)
         """,
     )
 
@@ -551,7 +1166,7 @@ Output Formats:
     parser.add_argument(
         "--format",
         "-f",
-        choices=["simple", "detailed", "csv"],
+        choices=["simple", "detailed", "csv", "binary"],
         default="simple",
         help="Output format (default: simple)",
     )
@@ -580,6 +1195,22 @@ Output Formats:
         "--no-metadata", action="store_true", help="Exclude metadata headers"
     )
 
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Gzip-compress the channel files (E{channel}.txt.gz)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-w",
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, 1 for serial)",
+    )
+
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -594,6 +1225,8 @@ Output Formats:
             include_metadata=not args.no_metadata,
             sample_rate=args.sample_rate,
             gap_threshold=args.gap_threshold,
+            max_workers=args.workers,
+            compress=args.compress,
         )
 
         if args.verbose:
@@ -601,9 +1234,10 @@ Output Formats:
             for ndf_file, text_files in results.items():
                 print(f"\n{ndf_file}:")
                 for text_file in text_files:
-                    file_size = (
-                        os.path.getsize(text_file) if os.path.exists(text_file) else 0
-                    )
+                    try:
+                        file_size = os.path.getsize(text_file)
+                    except OSError:
+                        file_size = 0
                     print(f"  -> {text_file} ({file_size:,} bytes)")
 
         return 0
@@ -0,0 +1,243 @@
+"""Tests for bulk LabChart conversion functionality."""
+
+import gzip
+import importlib
+import os
+import sys
+import tempfile
+from concurrent.futures import Future
+
+import pytest
+
+from bulk_converter import (
+    bulk_convert,
+    convert_directory,
+    find_channel_directories,
+    find_channel_files,
+)
+from labchart_exporter import LabChartExporter
+
+
+def create_session_directory(parent: str, name: str, channels: dict) -> str:
+    """Helper to create a session directory with E{channel}.txt files."""
+    session_dir = os.path.join(parent, name)
+    os.makedirs(session_dir)
+    for channel, values in channels.items():
+        with open(os.path.join(session_dir, f"E{channel}.txt"), "w") as f:
+            for value in values:
+                f.write(f"{value}\n")
+    return session_dir
+
+
+class TestModuleImport:
+    """Test cases for importing the module on older Python versions."""
+
+    def test_import_without_subscriptable_future(self, monkeypatch):
+        """Test that no annotation subscripts Future at import time (< 3.9)."""
+        if hasattr(Future, "__class_getitem__"):
+            monkeypatch.delattr(Future, "__class_getitem__")
+        monkeypatch.delitem(sys.modules, "bulk_converter")
+
+        module = importlib.import_module("bulk_converter")
+
+        assert callable(module.bulk_convert)
+
+
+class TestChannelDiscovery:
+    """Test cases for session directory and channel file discovery."""
+
+    def test_find_channel_files_skips_empty_and_unrelated(self):
+        """Test that only non-empty E{channel}.txt files are returned."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session_dir = create_session_directory(
+                temp_dir, "session_1555404530", {1: [32768], 12: [32768]}
+            )
+            open(os.path.join(session_dir, "E3.txt"), "w").close()
+            open(os.path.join(session_dir, "notes.txt"), "w").close()
+            os.makedirs(os.path.join(session_dir, "E4.txt"))
+
+            channel_files = find_channel_files(session_dir)
+
+            assert channel_files == {
+                1: os.path.join(session_dir, "E1.txt"),
+                12: os.path.join(session_dir, "E12.txt"),
+            }
+
+    def test_find_channel_files_compressed(self):
+        """Test that E{channel}.txt.gz files are found, plain files first."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session_dir = create_session_directory(
+                temp_dir, "session_1555404530", {2: [32768]}
+            )
+            for channel in [1, 2]:
+                path = os.path.join(session_dir, f"E{channel}.txt.gz")
+                with gzip.open(path, "wt") as f:
+                    f.write("32768\n")
+
+            assert find_channel_files(session_dir) == {
+                1: os.path.join(session_dir, "E1.txt.gz"),
+                2: os.path.join(session_dir, "E2.txt"),
+            }
+
+    def test_find_channel_directories_sorted(self):
+        """Test that only directories with channel files are returned, in order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            second = create_session_directory(temp_dir, "session_1555404600", {1: [1]})
+            first = create_session_directory(temp_dir, "session_1555404530", {1: [1]})
+            other = create_session_directory(temp_dir, "archive", {1: [1]})
+            os.makedirs(os.path.join(temp_dir, "empty_dir"))
+            open(os.path.join(temp_dir, "E1.txt"), "w").close()
+
+            # Sessions come first in timestamp order, other directories after
+            assert find_channel_directories(temp_dir) == [first, second, other]
+
+            # Unsorted discovery finds the same directories
+            unsorted = find_channel_directories(temp_dir, sort=False)
+            assert sorted(unsorted) == sorted([first, second, other])
+
+
+class TestBulkConvert:
+    """Test cases for bulk_convert."""
+
+    def test_bulk_convert_missing_input(self):
+        """Test error handling for a missing input directory."""
+        with pytest.raises(FileNotFoundError):
+            bulk_convert("/nonexistent/path/to/sessions")
+
+    def test_bulk_convert_input_not_a_directory(self):
+        """Test error handling when the input path is a file."""
+        with tempfile.NamedTemporaryFile() as temp_file:
+            with pytest.raises(NotADirectoryError):
+                bulk_convert(temp_file.name)
+
+    def test_bulk_convert_empty_input_creates_nothing(self):
+        """Test that no output directory is created when nothing is found."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            output_dir = os.path.join(temp_dir, "output")
+            os.makedirs(input_dir)
+
+            assert bulk_convert(input_dir, output_dir) == []
+            assert not os.path.exists(output_dir)
+
+    def test_bulk_convert_serial(self):
+        """Test serial conversion of session directories."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            output_dir = os.path.join(temp_dir, "output")
+            create_session_directory(
+                input_dir, "session_1555404530", {1: [32768] * 4, 2: [32769] * 4}
+            )
+
+            created_files = bulk_convert(input_dir, output_dir, max_workers=1)
+
+            assert created_files == [os.path.join(output_dir, "session_1555404530.txt")]
+            with open(created_files[0], "r") as f:
+                content = f.read()
+                assert "ChannelTitle= 1, 2" in content
+
+    def test_bulk_convert_parallel_matches_serial(self):
+        """Test that parallel conversion produces the same files as serial."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            for i, timestamp in enumerate([1555404530, 1555404600, 1555404700]):
+                create_session_directory(
+                    input_dir,
+                    f"session_{timestamp}",
+                    {0: [32768 + i] * 8, 1: [32700 + i] * 32},
+                )
+
+            serial_dir = os.path.join(temp_dir, "serial")
+            parallel_dir = os.path.join(temp_dir, "parallel")
+            serial_files = bulk_convert(input_dir, serial_dir, max_workers=1)
+            parallel_files = bulk_convert(input_dir, parallel_dir, max_workers=3)
+
+            assert len(parallel_files) == 3
+            assert [os.path.basename(p) for p in parallel_files] == [
+                os.path.basename(p) for p in serial_files
+            ]
+            for serial_file, parallel_file in zip(serial_files, parallel_files):
+                with open(serial_file, "r") as f1, open(parallel_file, "r") as f2:
+                    assert f1.read() == f2.read()
+
+    def test_bulk_convert_parallel_reports_worker_logs(self, capsys):
+        """Test that worker progress messages reach the parent's stdout."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            for timestamp in [1555404530, 1555404600]:
+                create_session_directory(
+                    input_dir, f"session_{timestamp}", {1: [32768] * 4}
+                )
+
+            bulk_convert(input_dir, os.path.join(temp_dir, "out"), max_workers=2)
+
+            output = capsys.readouterr().out
+            assert "Processing: session_1555404530" in output
+            assert "Processing: session_1555404600" in output
+
+    def test_bulk_convert_compressed_matches_plain(self):
+        """Test that gzip-compressed channel files convert like plain ones."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            values = {1: [32768, 32769, 32770], 2: [30000] * 3}
+            plain_dir = os.path.join(temp_dir, "plain")
+            create_session_directory(plain_dir, "session_1555404530", values)
+            compressed_dir = os.path.join(temp_dir, "compressed", "session_1555404530")
+            os.makedirs(compressed_dir)
+            for channel, samples in values.items():
+                path = os.path.join(compressed_dir, f"E{channel}.txt.gz")
+                with gzip.open(path, "wt") as f:
+                    f.writelines(f"{value}\n" for value in samples)
+
+            outputs = []
+            for input_dir in [plain_dir, os.path.dirname(compressed_dir)]:
+                output_dir = input_dir + "_out"
+                (output_file,) = bulk_convert(input_dir, output_dir, max_workers=1)
+                with open(output_file, "r") as f:
+                    outputs.append(f.read().split("\n", 1)[1])
+
+            assert outputs[0] == outputs[1]
+
+    def test_convert_directory_failed_export_leaves_no_file(self, monkeypatch):
+        """Test that an export failing part way removes the partial output file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            session_dir = create_session_directory(
+                temp_dir, "session_1555404530", {1: [32768] * 4}
+            )
+            output_dir = os.path.join(temp_dir, "output")
+            os.makedirs(output_dir)
+            exporter = LabChartExporter()
+
+            def failing_write(stream, channel_data, channels, creation_date=None):
+                stream.write(b"partial")
+                raise OSError("simulated write failure")
+
+            monkeypatch.setattr(exporter, "_write_multi_channel", failing_write)
+
+            assert convert_directory(session_dir, output_dir, exporter) is None
+            assert os.listdir(output_dir) == []
+
+    def test_bulk_convert_cache_reused_and_refreshed(self):
+        """Test that cached samples give the same output and go stale on change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            session_dir = create_session_directory(
+                input_dir, "session_1555404530", {1: [32768, 32769, 32770]}
+            )
+            channel_file = os.path.join(session_dir, "E1.txt")
+
+            def convert(name):
+                output_dir = os.path.join(temp_dir, name)
+                (output_file,) = bulk_convert(
+                    input_dir, output_dir, max_workers=1, use_cache=True
+                )
+                with open(output_file, "r") as f:
+                    return f.read().split("\n", 5)[5]
+
+            first = convert("first")
+            assert os.path.exists(channel_file + ".samples")
+            assert convert("second") == first
+
+            # Changing the source file invalidates its cache
+            with open(channel_file, "a") as f:
+                f.write("40000\n")
+            assert convert("third").count("\n") == 4
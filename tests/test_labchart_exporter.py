@@ -1,5 +1,6 @@
 """Tests for LabChart exporter functionality."""
 
+import io
 import os
 import tempfile
 
@@ -92,6 +93,13 @@ class TestLabChartExporter:
         filtered = exporter._apply_glitch_filter(values)
         assert filtered[2] == 1015  # Should be average of 1010 and 1020
 
+    def test_glitch_filter_without_glitch_returns_input(self):
+        """Test that clean data is returned as-is instead of copied."""
+        exporter = LabChartExporter(glitch_threshold=100)
+        values = [1000, 1050, 1250, 1300, 1350]  # Wide range but glitch-free
+        filtered = exporter._apply_glitch_filter(values)
+        assert filtered is values
+
     def test_glitch_filter_short_array(self):
         """Test glitch filter with array too short to filter."""
         exporter = LabChartExporter(glitch_threshold=100)
@@ -150,6 +158,71 @@ class TestLabChartExporter:
                 assert len(lines) > 10  # Header + data lines
                 assert "ChannelTitle= 2" in "".join(lines)
 
+    def test_export_channel_appends_to_existing_file(self):
+        """Test that a second export_channel call appends without a new header."""
+        exporter = LabChartExporter()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter.export_channel(temp_dir, 3, [(0.0, [32768, 32769])])
+            output_file = exporter.export_channel(temp_dir, 3, [(1.0, [32770])])
+
+            with open(output_file, "r") as f:
+                lines = f.read().splitlines()
+
+            assert sum(line.startswith("Interval=") for line in lines) == 1
+            assert len(lines) == 5 + 3
+            assert lines[-1].startswith("1.000000 ")
+
+    def test_export_channel_recreates_deleted_file_with_header(self):
+        """Test that a file removed between calls is written again with a header."""
+        exporter = LabChartExporter()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = exporter.export_channel(temp_dir, 3, [(0.0, [32768])])
+            os.remove(output_file)
+            exporter.export_channel(temp_dir, 3, [(5.0, [32770])])
+
+            with open(output_file, "r") as f:
+                lines = f.read().splitlines()
+
+            assert lines[0].startswith("Interval=")
+            # Relative times restart from the recreated file's first interval
+            assert lines[-1].startswith("0.000000 ")
+
+    def test_export_interval_sample_times_do_not_drift(self):
+        """Test that sample times are exact multiples of the sample period."""
+        exporter = LabChartExporter(sample_rate=500.0, absolute_time=True)
+        start = 1.5e9
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "E1.txt")
+            exporter.export_interval(output_file, 1, [32768] * 500, start)
+
+            with open(output_file, "r") as f:
+                lines = f.read().splitlines()[5:]
+
+        times = [line.split(" ")[0] for line in lines]
+        assert times == [f"{start + i / 500.0:.6f}" for i in range(500)]
+
+    def test_export_interval_power_of_two_rate_times(self):
+        """Test cached time fractions against formatting each sample time."""
+        exporter = LabChartExporter(sample_rate=512.0, absolute_time=True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "E1.txt")
+            for start in [1555404530.0, 1555404531.5]:
+                exporter.export_interval(output_file, 1, [32768] * 1030, start)
+
+            with open(output_file, "r") as f:
+                lines = f.read().splitlines()[5:]
+
+        times = [line.split(" ")[0] for line in lines]
+        assert times == [
+            f"{start + i / 512.0:.6f}"
+            for start in [1555404530.0, 1555404531.5]
+            for i in range(1030)
+        ]
+
     def test_mV_per_count_calculation(self):
         """Test that mV per count is calculated correctly."""
         exporter = LabChartExporter(range_mV=240.0)
@@ -314,3 +387,44 @@ class TestMultiChannelExport:
                 content = f.read()
                 # Channels should be sorted: 1, 5, 15
                 assert "ChannelTitle= 1, 5, 15" in content
+
+    def test_export_multi_channel_to_stream(self):
+        """Test writing a multi-channel export to a binary stream."""
+        exporter = LabChartExporter()
+        stream = io.BytesIO()
+
+        channel_data = {
+            1: [(0.0, [32768, 33000])],
+            2: [(0.0, [32768, 33000])],
+        }
+
+        rows = exporter.export_multi_channel_to_stream(
+            stream, channel_data, creation_date="2023-01-01 12:00:00"
+        )
+
+        lines = stream.getvalue().decode("ascii").splitlines()
+        assert rows == 2
+        assert lines[1] == "DateTime= 2023-01-01 12:00:00"
+        assert lines[3] == "ChannelTitle= 1, 2"
+        assert lines[5] == "0.000000\t60.0000\t60.0000"
+        assert len(lines) == 7
+
+    def test_export_multi_channel_merges_unaligned_timelines(self):
+        """Test that channels without a shared grid are merged in time order."""
+        exporter = LabChartExporter(glitch_threshold=0)
+        stream = io.BytesIO()
+
+        # Channel 0 (128 Hz) samples fall between channel 1 (512 Hz) samples
+        channel_data = {
+            0: [(0.001, [32768, 32768])],
+            1: [(0.0, [0, 0, 0, 0, 0, 0])],
+        }
+
+        rows = exporter.export_multi_channel_to_stream(stream, channel_data)
+
+        lines = stream.getvalue().decode("ascii").splitlines()[5:]
+        times = [float(line.split("\t")[0]) for line in lines]
+        assert rows == 8
+        assert times == sorted(times)
+        assert lines[1] == "0.001000\t60.0000\t"
+        assert lines[0] == "0.000000\t\t0.0000"
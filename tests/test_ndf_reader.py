@@ -2,6 +2,7 @@
 
 import struct
 import tempfile
+from array import array
 
 import pytest
 
@@ -29,6 +30,8 @@ class TestSimpleBinarySignalReader:
 
             # Should have 3 intervals (6 samples / 2 samples per interval)
             assert len(intervals) == 3
+            assert all(isinstance(v, array) for _, v in intervals)
+            intervals = [(t, list(v)) for t, v in intervals]
             assert intervals[0] == (0.0, [1000, 2000])
             assert intervals[1] == (
                 1.0,
@@ -52,6 +55,7 @@ class TestSimpleBinarySignalReader:
 
             # Should have 2 intervals: [1000, 2000] and [3000]
             assert len(intervals) == 2
+            intervals = [(t, list(v)) for t, v in intervals]
             assert intervals[0] == (0.0, [1000, 2000])
             assert intervals[1] == (1.0, [3000])
 
@@ -146,6 +150,55 @@ another_invalid
             assert intervals[0] == (0.0, [1000, 2000])
             assert intervals[1] == (1.0, [3000, 4000])
 
+    def test_read_signal_windows_line_endings(self):
+        """Test reading a text file written with CRLF line endings."""
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as temp_file:
+            temp_file.write(b"# comment\r\n1000\r\n2000\r\n\r\n3000\r\n")
+            temp_file.flush()
+
+            intervals = TextSignalReader.read_signal(
+                filepath=temp_file.name, sample_rate=2.0, interval_length=1.0
+            )
+
+            assert intervals == [(0.0, [1000, 2000]), (1.0, [3000])]
+
+    def test_parse_signal_from_text(self):
+        """Test parsing already-read text content."""
+        intervals = TextSignalReader.parse_signal(
+            "# header\n1000\n2000\n\n3000\n", sample_rate=2.0, interval_length=1.0
+        )
+
+        assert intervals == [(0.0, [1000, 2000]), (1.0, [3000])]
+
+    def test_parse_samples_compact_intervals(self):
+        """Test parsing into a contiguous array split into array intervals."""
+        samples = TextSignalReader.parse_samples("# header\n1000\n2000\n3000\n")
+        intervals = TextSignalReader.split_intervals(
+            samples, sample_rate=2.0, interval_length=1.0
+        )
+
+        assert isinstance(samples, array)
+        assert [(t, list(v)) for t, v in intervals] == [
+            (0.0, [1000, 2000]),
+            (1.0, [3000]),
+        ]
+        assert all(isinstance(v, array) for _, v in intervals)
+        assert samples.typecode == "H"
+
+    def test_parse_samples_out_of_range(self):
+        """Test that values outside the 16-bit count range are kept intact."""
+        samples = TextSignalReader.parse_samples("-5\n70000\n")
+
+        assert samples.typecode == "q"
+        assert list(samples) == [-5, 70000]
+
+    def test_parse_samples_from_bytes_with_floats(self):
+        """Test that non-integer lines fall back to the tolerant parser."""
+        samples = TextSignalReader.parse_samples(b"100.7\nbad\n200\n")
+
+        assert samples.typecode == "H"
+        assert list(samples) == [100, 200]
+
     def test_read_signal_empty_file(self):
         """Test reading empty text file."""
         with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
@@ -191,3 +244,78 @@ class TestNDFReader:
             # Should return 'Unknown' or current date
             assert isinstance(creation_date, str)
             assert len(creation_date) > 0
+
+    def test_read_channel_data_groups_messages_by_channel(self):
+        """Test that messages are split by channel and ordered by timestamp."""
+        messages = [
+            # (timestamp, identifier, sample1, sample2)
+            (2002, 0x31, 30, 40),
+            (2001, 0x12, 500, 600),
+            (2000, 0x21, 10, 20),
+            (2003, 0x01, 50, 60),
+        ] * 20
+        with tempfile.NamedTemporaryFile(suffix=".ndf", delete=False) as temp_file:
+            temp_file.write(b" ndf" + b"\x00" * 508)
+            for message in messages:
+                temp_file.write(struct.pack("<HHHH", *message))
+            temp_file.write(b"\x01\x02\x03")  # Trailing partial message
+            temp_file.flush()
+
+            reader = NDFReader(temp_file.name)
+            assert reader.data_start_offset == 512
+            assert reader.get_available_channels() == [1, 2]
+            intervals = reader.read_channel_data(2, sample_rate=4.0)
+            assert all(isinstance(v, array) for _, v in intervals)
+            assert [(t, list(v)) for t, v in intervals] == [
+                (float(i), [500, 600, 500, 600]) for i in range(10)
+            ]
+            intervals = reader.read_channel_data(1, sample_rate=8.0)
+            assert len(intervals) == 15
+            assert list(intervals[4][1]) == [10, 20] * 4
+            assert list(intervals[5][1]) == [30, 40] * 4
+            assert list(intervals[10][1]) == [50, 60] * 4
+
+            # Odd interval lengths take whole messages and drop the extra sample
+            intervals = reader.read_channel_data(2, sample_rate=3.0)
+            assert [list(v) for _, v in intervals] == [[500, 600, 500]] * 10
+
+            # The lazy sequence gives the same intervals, built on access
+            lazy = reader.iter_channel_data(1, sample_rate=8.0)
+            eager = reader.read_channel_data(1, sample_rate=8.0)
+            assert len(lazy) == 15
+            assert [(t, list(v)) for t, v in lazy] == [(t, list(v)) for t, v in eager]
+            assert lazy[-1][0] == 14.0
+            assert [t for t, _ in lazy[2:4]] == [2.0, 3.0]
+            with pytest.raises(IndexError):
+                lazy[15]
+
+            # Parsing holds no view of the map, so it can still be closed
+            reader.close()
+
+    def test_empty_file_and_close(self):
+        """Test that an empty file can be opened and closing is repeatable."""
+        with tempfile.NamedTemporaryFile(suffix=".ndf", delete=False) as temp_file:
+            reader = NDFReader(temp_file.name)
+            assert reader.get_available_channels() == []
+            reader.close()
+            reader.close()
+
+    def test_file_duration_without_parsing(self):
+        """Test that the duration comes from the data size, leaving it unparsed."""
+        with tempfile.NamedTemporaryFile(suffix=".ndf", delete=False) as temp_file:
+            temp_file.write(b" ndf" + b"\x00" * 508)
+            temp_file.write(struct.pack("<HHHH", 2000, 0x01, 10, 20) * 256)
+            temp_file.write(b"\x01\x02\x03")  # Trailing partial message
+            temp_file.flush()
+
+            reader = NDFReader(temp_file.name)
+            assert reader.get_file_duration() == 1.0
+            assert reader._parsed_messages is None
+
+    def test_parse_archive_start_time_from_name(self):
+        """Test that the start time is parsed from a path that need not exist."""
+        assert NDFReader.parse_archive_start_time("/no/dir/M1555404530.ndf") == (
+            1555404530
+        )
+        assert NDFReader.parse_archive_start_time("m1555404530.NDF") == 1555404530
+        assert NDFReader.parse_archive_start_time("M123.ndf") is None
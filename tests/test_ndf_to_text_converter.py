@@ -1,11 +1,15 @@
 """Tests for NDF to text converter functionality."""
 
+import gzip
+import multiprocessing
 import os
 import struct
 import tempfile
+from array import array
 
 import pytest
 
+from ndf_reader import SimpleBinarySignalReader, TextSignalReader
 from ndf_to_text_converter import NDFToTextConverter, bulk_convert_ndf_to_text
 from tests.ndf_test_utils import create_multi_channel_ndf_file, create_valid_ndf_file
 
@@ -31,6 +35,11 @@ class TestNDFToTextConverter:
         assert converter.include_timestamps is True
         assert converter.include_metadata is False
 
+    def test_init_unknown_format(self):
+        """Test that an unknown output format is rejected up front."""
+        with pytest.raises(ValueError, match="Unknown output format"):
+            NDFToTextConverter(output_format="xml")
+
 
 class TestConvertNDFFile:
     """Test cases for convert_ndf_file functionality."""
@@ -79,6 +88,50 @@ class TestConvertNDFFile:
                 assert "# NDF to Text Conversion" in content
                 assert "# Channel: 1" in content
 
+    def test_metadata_dates_shared_across_channels(self):
+        """Test that every channel file of one conversion has the same dates."""
+        converter = NDFToTextConverter(output_format="detailed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ndf_file = os.path.join(temp_dir, "M1555404530.ndf")
+            create_multi_channel_ndf_file(ndf_file, channel_messages=[(0, 20), (1, 20)])
+
+            created_files = converter.convert_ndf_file(
+                input_file=ndf_file,
+                output_dir=os.path.join(temp_dir, "output"),
+            )
+
+            headers = []
+            for output_file in created_files:
+                with open(output_file, "r") as f:
+                    headers.append(
+                        [
+                            line
+                            for line in f
+                            if line.startswith(("# Creation", "# Conv"))
+                        ]
+                    )
+            assert len(created_files) == 2
+            assert len(headers[0]) == 2
+            assert headers[0] == headers[1]
+
+    def test_reported_file_size_matches_disk(self, capsys):
+        """Test that the logged byte count is the size of the written file."""
+        converter = NDFToTextConverter(output_format="csv", include_timestamps=True)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ndf_file = os.path.join(temp_dir, "M1555404530.ndf")
+            create_valid_ndf_file(ndf_file, channel=1, num_messages=20)
+
+            (output_file,) = converter.convert_ndf_file(
+                input_file=ndf_file,
+                output_dir=os.path.join(temp_dir, "output"),
+                channels=[1],
+            )
+
+            file_size = os.path.getsize(output_file)
+            assert f"E1.txt ({file_size:,} bytes)" in capsys.readouterr().out
+
     def test_convert_ndf_file_without_metadata(self):
         """Test that metadata is excluded when not requested."""
         converter = NDFToTextConverter(output_format="simple", include_metadata=False)
@@ -165,6 +218,46 @@ class TestConvertNDFFile:
                 first_line = f.readline()
                 assert "timestamp" in first_line
 
+    def test_csv_rows_from_arrays_and_lists(self):
+        """Test that 16-bit arrays and plain lists give the same CSV rows."""
+        converter = NDFToTextConverter(output_format="csv", include_metadata=False)
+        values = [0, 1, 32768, 65535]
+        expected = ["interval_time,sample_index,sample_value"] + [
+            f"2.000000,{i},{value}" for i, value in enumerate(values)
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "E1.txt")
+            for samples in [array("H", values), values]:
+                converter._write_csv_format(
+                    output_file, [(2.0, samples)], None, 1, 512.0, "", ""
+                )
+                with open(output_file, "r") as f:
+                    assert f.read().splitlines() == expected
+
+    def test_csv_sample_times(self):
+        """Test CSV sample times against per-sample float formatting."""
+        converter = NDFToTextConverter(
+            output_format="csv", include_timestamps=True, include_metadata=False
+        )
+        intervals = [(3.0, [1] * 600), (4.25, [2] * 5)]
+
+        for sample_rate in [512.0, 128.0, 1000.0]:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output_file = os.path.join(temp_dir, "E1.txt")
+                converter._write_csv_format(
+                    output_file, intervals, None, 1, sample_rate, "", ""
+                )
+
+                with open(output_file, "r") as f:
+                    rows = f.read().splitlines()[1:]
+
+            assert [row.split(",")[0] for row in rows] == [
+                f"{interval_time + i / sample_rate:.6f}"
+                for interval_time, samples in intervals
+                for i in range(len(samples))
+            ]
+
 
 class TestBulkConversion:
     """Test cases for bulk conversion functionality."""
@@ -237,6 +330,21 @@ class TestBulkConversion:
             found_files = find_ndf_files(temp_dir)
             assert len(found_files) == 2
 
+    def test_find_ndf_files_skips_directories_and_hidden(self):
+        """Test that only visible regular files match, in any extension case."""
+        from ndf_to_text_converter import find_ndf_files
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ["b.Ndf", "a.ndf", ".hidden.ndf"]:
+                with open(os.path.join(temp_dir, name), "w") as f:
+                    f.write("test")
+            os.makedirs(os.path.join(temp_dir, "folder.ndf"))
+
+            assert find_ndf_files(temp_dir) == [
+                os.path.join(temp_dir, "a.ndf"),
+                os.path.join(temp_dir, "b.Ndf"),
+            ]
+
     def test_find_ndf_files_invalid_path(self):
         """Test error handling for invalid path."""
         from ndf_to_text_converter import find_ndf_files
@@ -326,3 +434,214 @@ class TestBulkConvertWithSessions:
 
             # Should have created files for both channels
             assert len(results) == 1
+
+    def test_bulk_convert_parallel_matches_serial(self):
+        """Test that converting sessions in worker processes matches serial."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            # Two sessions; the second has two files that append in order
+            for timestamp, start in [
+                (1555404530, 10000),
+                (1555500000, 20000),
+                (1555500010, 30000),
+            ]:
+                create_valid_ndf_file(
+                    os.path.join(input_dir, f"M{timestamp}.ndf"),
+                    channel=1,
+                    start_timestamp=start,
+                )
+
+            outputs = {}
+            for workers in [1, 2]:
+                output_dir = os.path.join(temp_dir, f"out{workers}")
+                results = bulk_convert_ndf_to_text(
+                    input_path=input_dir,
+                    output_dir=output_dir,
+                    include_metadata=False,
+                    max_workers=workers,
+                )
+                outputs[workers] = {}
+                for session_name, files in results.items():
+                    for path in files:
+                        with open(path, "r") as f:
+                            outputs[workers][(session_name, path[-6:])] = f.read()
+
+            assert list(outputs[1]) == [
+                ("session_1555404530", "E1.txt"),
+                ("session_1555500000", "E1.txt"),
+            ]
+            assert outputs[1] == outputs[2]
+
+    def test_bulk_convert_single_session_files_in_parallel(self):
+        """Test that a session's files converted by several workers append in order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            for i, start in enumerate([10000, 20000, 30000, 40000]):
+                create_valid_ndf_file(
+                    os.path.join(input_dir, f"M{1555500000 + 10 * i}.ndf"),
+                    channel=1,
+                    start_timestamp=start,
+                )
+
+            outputs = []
+            for workers in [1, 3]:
+                output_dir = os.path.join(temp_dir, f"out{workers}")
+                results = bulk_convert_ndf_to_text(
+                    input_path=input_dir, output_dir=output_dir, max_workers=workers
+                )
+                (path,) = results["session_1555500000"]
+                with open(path, "r") as f:
+                    lines = f.readlines()
+                outputs.append([l for l in lines if not l.startswith("# Conversion")])
+                # Part directories are removed once appended
+                assert os.listdir(os.path.dirname(path)) == ["E1.txt"]
+
+            assert outputs[0] == outputs[1]
+
+    def test_bulk_convert_ignores_stale_part_directories(self):
+        """Test that parts left by an interrupted run are not merged again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            for i in range(3):
+                create_valid_ndf_file(
+                    os.path.join(input_dir, f"M{1555500000 + 10 * i}.ndf"), channel=1
+                )
+
+            outputs = []
+            for stale in [False, True]:
+                output_dir = os.path.join(temp_dir, f"out{stale}")
+                if stale:
+                    part_dir = os.path.join(output_dir, "session_1555500000", ".part1")
+                    os.makedirs(part_dir)
+                    with open(os.path.join(part_dir, "E1.txt"), "w") as f:
+                        f.write("1\n" * 50)
+                results = bulk_convert_ndf_to_text(
+                    input_path=input_dir, output_dir=output_dir, max_workers=2
+                )
+                (path,) = results["session_1555500000"]
+                with open(path, "r") as f:
+                    lines = f.readlines()
+                outputs.append([l for l in lines if not l.startswith("# Conversion")])
+
+            assert outputs[0] == outputs[1]
+
+    def test_bulk_convert_skips_failed_later_file(self, monkeypatch):
+        """Test that a failing later file is dropped whole, serial or parallel."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            expected_dir = os.path.join(temp_dir, "expected")
+            os.makedirs(input_dir)
+            os.makedirs(expected_dir)
+            # The middle file is longer, which marks it as the one that fails
+            for i, num_messages in enumerate([100, 300, 100]):
+                name = f"M{1555500000 + 10 * i}.ndf"
+                for directory in [input_dir, expected_dir]:
+                    if directory == input_dir or num_messages == 100:
+                        create_valid_ndf_file(
+                            os.path.join(directory, name),
+                            channel=1,
+                            num_messages=num_messages,
+                        )
+
+            def convert(source_dir, name, workers):
+                results = bulk_convert_ndf_to_text(
+                    input_path=source_dir,
+                    output_dir=os.path.join(temp_dir, name),
+                    include_metadata=False,
+                    max_workers=workers,
+                )
+                (path,) = results["session_1555500000"]
+                with open(path, "r") as f:
+                    return f.read()
+
+            expected = convert(expected_dir, "out_expected", 1)
+
+            # Appending the failing file writes its samples, then raises
+            append_channel = NDFToTextConverter._append_channel
+
+            def failing_append(converter, output_file, intervals):
+                append_channel(converter, output_file, intervals)
+                if len(intervals) == 2:
+                    raise OSError("simulated write failure")
+
+            monkeypatch.setattr(NDFToTextConverter, "_append_channel", failing_append)
+
+            assert convert(input_dir, "out_serial", 1) == expected
+            # Workers only see the patch when they are forked from this process
+            if multiprocessing.get_start_method() == "fork":
+                assert convert(input_dir, "out_parallel", 2) == expected
+
+    def test_bulk_convert_compressed_matches_plain(self):
+        """Test that compressed output, appended files included, matches plain."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            # One session of two files, so the second appends to the first
+            for timestamp, start in [(1555500000, 20000), (1555500010, 30000)]:
+                create_valid_ndf_file(
+                    os.path.join(input_dir, f"M{timestamp}.ndf"),
+                    channel=1,
+                    start_timestamp=start,
+                )
+
+            contents = {}
+            for compress in [False, True]:
+                results = bulk_convert_ndf_to_text(
+                    input_path=input_dir,
+                    output_dir=os.path.join(temp_dir, f"out{compress}"),
+                    include_metadata=False,
+                    max_workers=1,
+                    compress=compress,
+                )
+                (files,) = results.values()
+                (contents[compress],) = files
+            with open(contents[False], "rb") as f:
+                plain = f.read()
+            with gzip.open(contents[True], "rb") as f:
+                decompressed = f.read()
+
+            assert contents[True].endswith("E1.txt.gz")
+            assert plain and decompressed == plain
+
+    def test_bulk_convert_binary_matches_simple(self):
+        """Test that binary output reads back as the simple format's samples."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            os.makedirs(input_dir)
+            for timestamp, start in [(1555500000, 20000), (1555500010, 30000)]:
+                create_valid_ndf_file(
+                    os.path.join(input_dir, f"M{timestamp}.ndf"),
+                    channel=1,
+                    start_timestamp=start,
+                )
+
+            samples = {}
+            for output_format, compress in [
+                ("simple", False),
+                ("binary", False),
+                ("binary", True),
+            ]:
+                results = bulk_convert_ndf_to_text(
+                    input_path=input_dir,
+                    output_dir=os.path.join(temp_dir, f"{output_format}{compress}"),
+                    output_format=output_format,
+                    include_metadata=False,
+                    max_workers=1,
+                    compress=compress,
+                )
+                ((output_file,),) = results.values()
+                if output_format == "simple":
+                    intervals = TextSignalReader.read_signal(output_file)
+                else:
+                    intervals = SimpleBinarySignalReader.read_signal(output_file)
+                samples[(output_format, compress)] = [
+                    value for _, values in intervals for value in values
+                ]
+
+            assert output_file.endswith("E1.bin.gz")
+            assert samples[("simple", False)]
+            assert samples[("binary", False)] == samples[("simple", False)]
+            assert samples[("binary", True)] == samples[("simple", False)]
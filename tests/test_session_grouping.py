@@ -120,6 +120,18 @@ class TestSessionGrouping:
             assert len(sessions[0]) == 1
             assert sessions[0][0] == valid_file
 
+    def test_group_unreadable_file(self):
+        """Test that a file that can't be opened is skipped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            valid_file = self.create_mock_ndf_file(temp_dir, 1555404530)
+            # A directory with an NDF name can't be opened as a file
+            unreadable = os.path.join(temp_dir, "M1555404600.ndf")
+            os.makedirs(unreadable)
+
+            sessions = group_ndf_files_into_sessions([valid_file, unreadable])
+
+            assert sessions == [[valid_file]]
+
     def test_group_empty_list(self):
         """Test grouping empty file list."""
         sessions = group_ndf_files_into_sessions([])